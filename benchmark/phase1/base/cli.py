@@ -6,6 +6,8 @@ Usage: python cli.py <command> [options]
 
 import sys
 import argparse
+from functools import cache
+from typing import List, Optional
 from commands import (
     cmd_init, cmd_add_user, cmd_list_users,
     cmd_add_project, cmd_list_projects, cmd_show_project,
@@ -15,40 +17,23 @@ from commands import (
 )
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="taskmanager",
-        description="Task Manager CLI - Manage projects, tasks, and teams",
-    )
-    sub = parser.add_subparsers(dest="command", help="Available commands")
-
-    # init
-    sub.add_parser("init", help="Initialize data directory")
-
-    # user add
-    p = sub.add_parser("user-add", help="Add a user")
+def _build_user_add(p: argparse.ArgumentParser):
     p.add_argument("username")
     p.add_argument("email")
     p.add_argument("--role", default="member", choices=["admin", "member", "viewer"])
 
-    # user list
-    sub.add_parser("user-list", help="List users")
 
-    # project add
-    p = sub.add_parser("project-add", help="Create a project")
+def _build_project_add(p: argparse.ArgumentParser):
     p.add_argument("name")
     p.add_argument("--owner", type=int, required=True)
     p.add_argument("--description", default="")
 
-    # project list
-    sub.add_parser("project-list", help="List projects")
 
-    # project show
-    p = sub.add_parser("project-show", help="Show project details")
+def _build_project_show(p: argparse.ArgumentParser):
     p.add_argument("project_id", type=int)
 
-    # task add
-    p = sub.add_parser("task-add", help="Create a task")
+
+def _build_task_add(p: argparse.ArgumentParser):
     p.add_argument("title")
     p.add_argument("--project", type=int, required=True)
     p.add_argument("--assignee", type=int, default=None)
@@ -58,8 +43,8 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--tags", nargs="*", default=[])
     p.add_argument("--description", default="")
 
-    # task list
-    p = sub.add_parser("task-list", help="List tasks")
+
+def _build_task_list(p: argparse.ArgumentParser):
     p.add_argument("--status", default=None)
     p.add_argument("--priority", default=None)
     p.add_argument("--project", type=int, default=None)
@@ -70,12 +55,12 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--reverse", action="store_true")
     p.add_argument("--format", default="lines", choices=["lines", "table"])
 
-    # task show
-    p = sub.add_parser("task-show", help="Show task details")
+
+def _build_task_show(p: argparse.ArgumentParser):
     p.add_argument("task_id", type=int)
 
-    # task update
-    p = sub.add_parser("task-update", help="Update a task")
+
+def _build_task_update(p: argparse.ArgumentParser):
     p.add_argument("task_id", type=int)
     p.add_argument("--title", default=None)
     p.add_argument("--status", default=None)
@@ -85,109 +70,168 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--tags", nargs="*", default=None)
     p.add_argument("--description", default=None)
 
-    # task delete
-    p = sub.add_parser("task-delete", help="Delete a task")
+
+def _build_task_delete(p: argparse.ArgumentParser):
     p.add_argument("task_id", type=int)
     p.add_argument("--user", type=int, default=0)
 
-    # comment add
-    p = sub.add_parser("comment-add", help="Add a comment to a task")
+
+def _build_comment_add(p: argparse.ArgumentParser):
     p.add_argument("task_id", type=int)
     p.add_argument("--user", type=int, required=True)
     p.add_argument("text")
 
-    # export
-    p = sub.add_parser("export", help="Export tasks")
+
+def _build_export(p: argparse.ArgumentParser):
     p.add_argument("--format", default="csv", choices=["csv", "json", "markdown"])
     p.add_argument("--output", default="")
     p.add_argument("--status", default=None)
     p.add_argument("--project", type=int, default=None)
 
-    # summary
-    p = sub.add_parser("summary", help="Show task summary")
+
+def _build_summary(p: argparse.ArgumentParser):
     p.add_argument("--project", type=int, default=None)
 
+
+# Subcommand name -> (help text, argument builder or None)
+COMMANDS = {
+    "init": ("Initialize data directory", None),
+    "user-add": ("Add a user", _build_user_add),
+    "user-list": ("List users", None),
+    "project-add": ("Create a project", _build_project_add),
+    "project-list": ("List projects", None),
+    "project-show": ("Show project details", _build_project_show),
+    "task-add": ("Create a task", _build_task_add),
+    "task-list": ("List tasks", _build_task_list),
+    "task-show": ("Show task details", _build_task_show),
+    "task-update": ("Update a task", _build_task_update),
+    "task-delete": ("Delete a task", _build_task_delete),
+    "comment-add": ("Add a comment to a task", _build_comment_add),
+    "export": ("Export tasks", _build_export),
+    "summary": ("Show task summary", _build_summary),
+}
+
+
+@cache
+def build_parser() -> argparse.ArgumentParser:
+    """Build the full argument parser, with every subcommand's arguments (memoized)."""
+    parser = argparse.ArgumentParser(
+        prog="taskmanager",
+        description="Task Manager CLI - Manage projects, tasks, and teams",
+    )
+    sub = parser.add_subparsers(dest="command", help="Available commands")
+
+    for name, (help_text, builder) in COMMANDS.items():
+        p = sub.add_parser(name, help=help_text)
+        if builder is not None:
+            builder(p)
+
     return parser
 
 
-def main():
+@cache
+def _command_parser(command: str) -> argparse.ArgumentParser:
+    """Standalone parser for a single known subcommand (memoized)."""
+    _, builder = COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f"taskmanager {command}")
+    if builder is not None:
+        builder(parser)
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command-line arguments. Returns (args, parser).
+
+    A known subcommand is parsed by a standalone parser holding only that
+    command's arguments, skipping the top-level parser and the subparser
+    table. ``--help``, a missing command or an unknown one go through the
+    full parser so usage and error output stay the same.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    command = argv[0] if argv else None
+    if command in COMMANDS:
+        parser = _command_parser(command)
+        args = parser.parse_args(argv[1:])
+        args.command = command
+        return args, parser
+
     parser = build_parser()
-    args = parser.parse_args()
+    return parser.parse_args(argv), parser
+
+
+# argparse dest -> filter/update key, in the order the keys are applied
+_TASK_LIST_FILTERS = (
+    ("status", "status"), ("priority", "priority"), ("project", "project_id"),
+    ("assignee", "assignee_id"), ("tag", "tag"), ("search", "search"),
+)
+_EXPORT_FILTERS = (("status", "status"), ("project", "project_id"))
+_TASK_UPDATES = (
+    ("title", "title"), ("status", "status"), ("priority", "priority"),
+    ("assignee", "assignee_id"), ("due", "due_date"), ("tags", "tags"),
+    ("description", "description"),
+)
+
+
+def _filters_from_args(args, fields=_TASK_LIST_FILTERS) -> dict:
+    """Collect the filter options that were given (non-empty) on the command line."""
+    return {key: getattr(args, dest) for dest, key in fields if getattr(args, dest)}
+
+
+def _updates_from_args(args) -> dict:
+    """Collect the task fields that were explicitly passed to task-update."""
+    return {key: getattr(args, dest) for dest, key in _TASK_UPDATES
+            if getattr(args, dest) is not None}
+
+
+def _run_task_list(args):
+    filters = _filters_from_args(args)
+    filters["sort_by"] = args.sort
+    filters["sort_reverse"] = args.reverse
+    cmd_list_tasks(filters=filters, format=args.format)
+
+
+def _run_task_update(args):
+    updates = _updates_from_args(args)
+    if not updates:
+        print("Error: No fields to update", file=sys.stderr)
+        sys.exit(1)
+    cmd_update_task(args.task_id, **updates)
+
+
+# Subcommand name -> handler taking the parsed args
+DISPATCH = {
+    "init": lambda a: cmd_init(),
+    "user-add": lambda a: cmd_add_user(a.username, a.email, a.role),
+    "user-list": lambda a: cmd_list_users(),
+    "project-add": lambda a: cmd_add_project(a.name, a.owner, a.description),
+    "project-list": lambda a: cmd_list_projects(),
+    "project-show": lambda a: cmd_show_project(a.project_id),
+    "task-add": lambda a: cmd_add_task(a.title, a.project, a.assignee,
+                                       a.priority, a.due, a.tags, a.description),
+    "task-list": _run_task_list,
+    "task-show": lambda a: cmd_show_task(a.task_id),
+    "task-update": _run_task_update,
+    "task-delete": lambda a: cmd_delete_task(a.task_id, a.user),
+    "comment-add": lambda a: cmd_add_comment(a.task_id, a.user, a.text),
+    "export": lambda a: cmd_export(format=a.format, output=a.output,
+                                   filters=_filters_from_args(a, _EXPORT_FILTERS)),
+    "summary": lambda a: cmd_summary(project_id=a.project),
+}
+
+
+def main():
+    args, parser = parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    if args.command == "init":
-        cmd_init()
-    elif args.command == "user-add":
-        cmd_add_user(args.username, args.email, args.role)
-    elif args.command == "user-list":
-        cmd_list_users()
-    elif args.command == "project-add":
-        cmd_add_project(args.name, args.owner, args.description)
-    elif args.command == "project-list":
-        cmd_list_projects()
-    elif args.command == "project-show":
-        cmd_show_project(args.project_id)
-    elif args.command == "task-add":
-        cmd_add_task(args.title, args.project, args.assignee,
-                     args.priority, args.due, args.tags, args.description)
-    elif args.command == "task-list":
-        filters = {}
-        if args.status:
-            filters["status"] = args.status
-        if args.priority:
-            filters["priority"] = args.priority
-        if args.project:
-            filters["project_id"] = args.project
-        if args.assignee:
-            filters["assignee_id"] = args.assignee
-        if args.tag:
-            filters["tag"] = args.tag
-        if args.search:
-            filters["search"] = args.search
-        filters["sort_by"] = args.sort
-        filters["sort_reverse"] = args.reverse
-        cmd_list_tasks(filters=filters, format=args.format)
-    elif args.command == "task-show":
-        cmd_show_task(args.task_id)
-    elif args.command == "task-update":
-        updates = {}
-        if args.title is not None:
-            updates["title"] = args.title
-        if args.status is not None:
-            updates["status"] = args.status
-        if args.priority is not None:
-            updates["priority"] = args.priority
-        if args.assignee is not None:
-            updates["assignee_id"] = args.assignee
-        if args.due is not None:
-            updates["due_date"] = args.due
-        if args.tags is not None:
-            updates["tags"] = args.tags
-        if args.description is not None:
-            updates["description"] = args.description
-        if not updates:
-            print("Error: No fields to update", file=sys.stderr)
-            sys.exit(1)
-        cmd_update_task(args.task_id, **updates)
-    elif args.command == "task-delete":
-        cmd_delete_task(args.task_id, args.user)
-    elif args.command == "comment-add":
-        cmd_add_comment(args.task_id, args.user, args.text)
-    elif args.command == "export":
-        filters = {}
-        if args.status:
-            filters["status"] = args.status
-        if args.project:
-            filters["project_id"] = args.project
-        cmd_export(format=args.format, output=args.output, filters=filters)
-    elif args.command == "summary":
-        cmd_summary(project_id=args.project)
-    else:
+    handler = DISPATCH.get(args.command)
+    if handler is None:
         parser.print_help()
         sys.exit(1)
+    handler(args)
 
 
 if __name__ == "__main__":
@@ -7,68 +7,95 @@ Export tasks to various formats.
 import csv
 import json
 import io
+import time
 from datetime import datetime
-from typing import List
+from typing import List, TextIO
 from models import Task
 
 
+CSV_FIELDNAMES = [
+    "id", "title", "project_id", "assignee_id", "status",
+    "priority", "description", "tags", "due_date",
+    "created_at", "updated_at", "completed_at",
+]
+
+
+def export_csv_stream(tasks: List[Task], fp: TextIO) -> int:
+    """Write tasks as CSV to an open text stream, one row at a time."""
+    writer = csv.DictWriter(fp, fieldnames=CSV_FIELDNAMES)
+    writer.writeheader()
+    count = 0
+    for t in tasks:
+        row = t.to_dict()
+        row["tags"] = ";".join(row.get("tags", []))
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def export_json_stream(tasks: List[Task], fp: TextIO) -> int:
+    """Write the JSON export document to an open text stream.
+
+    Records are serialized and written one at a time; the output is
+    identical to dumping the whole document with indent=2.
+    """
+    fp.write("{\n")
+    fp.write(f'  "exported_at": {json.dumps(datetime.now().isoformat())},\n')
+    fp.write(f'  "count": {len(tasks)},\n')
+    fp.write('  "tasks": [')
+    for i, t in enumerate(tasks):
+        fp.write(",\n    " if i else "\n    ")
+        record = json.dumps(t.to_dict(), indent=2, ensure_ascii=False)
+        fp.write(record.replace("\n", "\n    "))
+    fp.write("\n  ]\n}" if tasks else "]\n}")
+    return len(tasks)
+
+
+def export_markdown_stream(tasks: List[Task], fp: TextIO) -> int:
+    """Write tasks as a Markdown table to an open text stream, line by line."""
+    fp.write(
+        "# Task Export\n"
+        "\n"
+        f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n"
+        "\n"
+        "| ID | Title | Status | Priority | Assignee | Due Date |\n"
+        "|-----|-------|--------|----------|----------|----------|\n"
+    )
+    count = 0
+    for t in tasks:
+        due = t.due_date or "-"
+        assignee = str(t.assignee_id) if t.assignee_id else "-"
+        fp.write(
+            f"| {t.id} | {t.title} | {t.status} | {t.priority} "
+            f"| {assignee} | {due} |\n"
+        )
+        count += 1
+    fp.write(f"\n**Total: {count} tasks**")
+    return count
+
+
 def export_to_csv(tasks: List[Task], filepath: str) -> int:
     """Export tasks to CSV file. Returns number of rows written."""
     if not tasks:
         return 0
-    fieldnames = [
-        "id", "title", "project_id", "assignee_id", "status",
-        "priority", "description", "tags", "due_date",
-        "created_at", "updated_at", "completed_at",
-    ]
     with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for t in tasks:
-            row = t.to_dict()
-            row["tags"] = ";".join(row.get("tags", []))
-            writer.writerow(row)
-    return len(tasks)
+        return export_csv_stream(tasks, f)
 
 
 def export_to_json(tasks: List[Task], filepath: str) -> int:
     """Export tasks to JSON file. Returns number of records written."""
     if not tasks:
         return 0
-    data = {
-        "exported_at": datetime.now().isoformat(),
-        "count": len(tasks),
-        "tasks": [t.to_dict() for t in tasks],
-    }
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    return len(tasks)
+        return export_json_stream(tasks, f)
 
 
 def export_to_markdown(tasks: List[Task], filepath: str) -> int:
     """Export tasks as a Markdown table. Returns number of rows written."""
     if not tasks:
         return 0
-    lines = [
-        "# Task Export",
-        "",
-        f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
-        "",
-        "| ID | Title | Status | Priority | Assignee | Due Date |",
-        "|-----|-------|--------|----------|----------|----------|",
-    ]
-    for t in tasks:
-        due = t.due_date or "-"
-        assignee = str(t.assignee_id) if t.assignee_id else "-"
-        lines.append(
-            f"| {t.id} | {t.title} | {t.status} | {t.priority} "
-            f"| {assignee} | {due} |"
-        )
-    lines.append("")
-    lines.append(f"**Total: {len(tasks)} tasks**")
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    return len(tasks)
+        return export_markdown_stream(tasks, f)
 
 
 def generate_summary(tasks: List[Task]) -> dict:
@@ -80,13 +107,14 @@ def generate_summary(tasks: List[Task]) -> dict:
     by_priority = {}
     by_assignee = {}
     overdue_count = 0
+    now = time.time()
 
     for t in tasks:
         by_status[t.status] = by_status.get(t.status, 0) + 1
         by_priority[t.priority] = by_priority.get(t.priority, 0) + 1
         aid = t.assignee_id or "unassigned"
         by_assignee[aid] = by_assignee.get(aid, 0) + 1
-        if t.is_overdue():
+        if t.is_overdue(now):
             overdue_count += 1
 
     return {
@@ -4,6 +4,7 @@ Task Manager CLI - Formatters module.
 Display formatting for tasks, projects, and summaries.
 """
 
+from collections import Counter
 from typing import List, Optional, Dict, Any
 from models import Task, Project, User, EventLog, Comment
 
@@ -25,17 +26,41 @@ PRIORITY_MARKERS = {
     "low": "",
 }
 
+# Bound lookups for the per-row render loops
+_status_icon = STATUS_ICONS.get
+_priority_marker = PRIORITY_MARKERS.get
+
+
+# Optional segments of a task line, keyed by the bit set in the shape mask
+_LINE_SEGMENTS = (
+    (1, " [P{t.project_id}]"),
+    (2, " @{t.assignee_id}"),
+    (4, " due:{t.due_date}{overdue}"),
+    (8, "{t.tags_suffix()}"),
+)
+
+
+def _compile_line_formatter(mask: int):
+    """Generate a straight-line formatter for one combination of optional segments."""
+    template = "{icon} #{t.id} {marker} {t.title}" + "".join(
+        segment for bit, segment in _LINE_SEGMENTS if mask & bit
+    )
+    namespace = {}
+    exec(f"def _fmt(t, icon, marker, overdue):\n    return f{template!r}\n", namespace)
+    return namespace["_fmt"]
+
+
+# One formatter per (project, assignee, due, tags) shape, indexed by mask
+_LINE_FORMATTERS = tuple(_compile_line_formatter(mask) for mask in range(16))
+
 
 def format_task_line(task: Task, show_project: bool = False) -> str:
     """Format a single task as a one-line summary."""
-    icon = STATUS_ICONS.get(task.status, "?")
-    marker = PRIORITY_MARKERS.get(task.priority, "")
-    assignee = f" @{task.assignee_id}" if task.assignee_id else ""
-    project = f" [P{task.project_id}]" if show_project else ""
-    overdue = " OVERDUE" if task.is_overdue() else ""
-    due = f" due:{task.due_date}" if task.due_date else ""
-    tags = f" #{' #'.join(task.tags)}" if task.tags else ""
-    return f"{icon} #{task.id} {marker} {task.title}{project}{assignee}{due}{overdue}{tags}"
+    mask = ((1 if show_project else 0) | (2 if task.assignee_id else 0)
+            | (4 if task.due_date else 0) | (8 if task.tags else 0))
+    overdue = " OVERDUE" if mask & 4 and task.is_overdue() else ""
+    return _LINE_FORMATTERS[mask](task, _status_icon(task.status, "?"),
+                                  _priority_marker(task.priority, ""), overdue)
 
 
 def format_task_detail(task: Task, comments: Optional[List[Comment]] = None,
@@ -73,26 +98,27 @@ def format_task_detail(task: Task, comments: Optional[List[Comment]] = None,
     return "\n".join(lines)
 
 
+_TABLE_HEADER = f"{'ID':>5} {'Status':<12} {'Pri':<8} {'Title':<30} {'Assignee':<10} {'Due':<12}"
+_table_row = "{:>5} {:<12} {:<8} {:<30} {:<10} {:<12}".format
+
+
 def format_task_table(tasks: List[Task]) -> str:
     """Format tasks as an ASCII table."""
     if not tasks:
         return "(no tasks)"
 
-    header = f"{'ID':>5} {'Status':<12} {'Pri':<8} {'Title':<30} {'Assignee':<10} {'Due':<12}"
-    separator = "-" * len(header)
-    lines = [header, separator]
-
-    for t in tasks:
-        assignee = str(t.assignee_id) if t.assignee_id else "-"
-        due = t.due_date[:10] if t.due_date else "-"
-        title = t.title[:28] + ".." if len(t.title) > 30 else t.title
-        lines.append(
-            f"{t.id:>5} {t.status:<12} {t.priority:<8} {title:<30} {assignee:<10} {due:<12}"
+    separator = "-" * len(_TABLE_HEADER)
+    rows = [
+        _table_row(
+            t.id, t.status, t.priority,
+            t.title[:28] + ".." if len(t.title) > 30 else t.title,
+            str(t.assignee_id) if t.assignee_id else "-",
+            t.due_date[:10] if t.due_date else "-",
         )
-
-    lines.append(separator)
-    lines.append(f"Total: {len(tasks)} tasks")
-    return "\n".join(lines)
+        for t in tasks
+    ]
+    return "\n".join([_TABLE_HEADER, separator, *rows, separator,
+                      f"Total: {len(tasks)} tasks"])
 
 
 def format_project_line(project: Project, task_count: int = 0) -> str:
@@ -102,9 +128,7 @@ def format_project_line(project: Project, task_count: int = 0) -> str:
 
 def format_project_detail(project: Project, tasks: List[Task]) -> str:
     """Format detailed project view with task breakdown."""
-    by_status = {}
-    for t in tasks:
-        by_status[t.status] = by_status.get(t.status, 0) + 1
+    by_status = Counter(t.status for t in tasks)
 
     lines = [
         f"Project #{project.id}: {project.name}",
@@ -116,7 +140,7 @@ def format_project_detail(project: Project, tasks: List[Task]) -> str:
     if by_status:
         lines.append("  Breakdown:")
         for status, count in sorted(by_status.items()):
-            icon = STATUS_ICONS.get(status, "?")
+            icon = _status_icon(status, "?")
             lines.append(f"    {icon} {status}: {count}")
 
     return "\n".join(lines)
@@ -133,13 +157,13 @@ def format_summary(summary: dict) -> str:
         "By Status:",
     ]
     for status, count in sorted(summary.get("by_status", {}).items()):
-        icon = STATUS_ICONS.get(status, "?")
+        icon = _status_icon(status, "?")
         lines.append(f"  {icon} {status}: {count}")
 
     lines.append("")
     lines.append("By Priority:")
     for priority, count in sorted(summary.get("by_priority", {}).items()):
-        lines.append(f"  {PRIORITY_MARKERS.get(priority, '')} {priority}: {count}")
+        lines.append(f"  {_priority_marker(priority, '')} {priority}: {count}")
 
     if summary.get("overdue", 0) > 0:
         lines.append(f"\n⚠ Overdue: {summary['overdue']}")
@@ -5,12 +5,18 @@ Core data classes for User, Project, Task, and EventLog.
 """
 
 import json
-from dataclasses import dataclass, field, asdict
+import sys
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
 
+# Slotted dataclasses (3.10+) drop the per-instance __dict__
+_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class TaskStatus(Enum):
     TODO = "todo"
     IN_PROGRESS = "in_progress"
@@ -19,6 +25,10 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+_STATUS_VALUES = [s.value for s in TaskStatus]
+_VALID_STATUS = frozenset(_STATUS_VALUES)
+
+
 class TaskPriority(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -37,7 +47,7 @@ class EventType(Enum):
     COMMENT_ADDED = "comment_added"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class User:
     id: int
     username: str
@@ -56,10 +66,16 @@ class User:
         return self.role == "admin"
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "username": self.username,
+            "email": self.email,
+            "role": self.role,
+            "created_at": self.created_at,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class Task:
     id: int
     title: str
@@ -73,44 +89,120 @@ class Task:
     created_at: str = ""
     updated_at: str = ""
     completed_at: Optional[str] = None
+    # due_date parsed to an epoch timestamp, keyed by the string it came from
+    _due_src: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _due_epoch: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    # Rendered " #tag1 #tag2" suffix, keyed by a copy of the tags it came from
+    _tags_src: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    _tags_str: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        now = datetime.now().isoformat()
-        if not self.created_at:
-            self.created_at = now
-        if not self.updated_at:
-            self.updated_at = now
-
-    def is_overdue(self) -> bool:
+        # Loaded tasks already carry both timestamps; only new ones need the clock
+        if not self.created_at or not self.updated_at:
+            now = datetime.now().isoformat()
+            if not self.created_at:
+                self.created_at = now
+            if not self.updated_at:
+                self.updated_at = now
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Task":
+        """Rebuild a stored task without going through __init__/__post_init__.
+
+        Stored records carry every field, so the generated constructor's
+        default handling and timestamp stamping are pure overhead on load.
+        Records missing a timestamp take the regular constructor.
+        """
+        if not d.get("created_at") or not d.get("updated_at"):
+            return cls(**d)
+        t = object.__new__(cls)
+        t.id = d["id"]
+        t.title = d["title"]
+        t.project_id = d["project_id"]
+        t.assignee_id = d.get("assignee_id")
+        t.status = d.get("status", "todo")
+        t.priority = d.get("priority", "medium")
+        t.description = d.get("description", "")
+        t.tags = d.get("tags") or []
+        t.due_date = d.get("due_date")
+        t.created_at = d["created_at"]
+        t.updated_at = d["updated_at"]
+        t.completed_at = d.get("completed_at")
+        t._due_src = None
+        t._due_epoch = None
+        t._tags_src = None
+        t._tags_str = ""
+        return t
+
+    def tags_suffix(self) -> str:
+        """Tags rendered as " #a #b" for one-line display, cached on the task.
+
+        The rendering is redone whenever tags no longer equal the list it
+        was built from, whether they were reassigned or changed in place.
+        """
+        if self._tags_src != self.tags:
+            self._tags_str = " #" + " #".join(self.tags) if self.tags else ""
+            self._tags_src = list(self.tags)
+        return self._tags_str
+
+    def due_timestamp(self) -> Optional[float]:
+        """Return due_date as an epoch timestamp (None if unset or invalid).
+
+        The parse is cached on the instance and redone only when due_date changes.
+        """
+        if self._due_src != self.due_date:
+            try:
+                self._due_epoch = datetime.fromisoformat(self.due_date).timestamp()
+            except (TypeError, ValueError, OverflowError, OSError):
+                self._due_epoch = None
+            self._due_src = self.due_date
+        return self._due_epoch
+
+    def is_overdue(self, now: Optional[float] = None) -> bool:
+        """Check whether the task is past due. `now` is an epoch timestamp,
+        letting callers checking many tasks read the clock once."""
         if not self.due_date or self.status == "done":
             return False
-        try:
-            due = datetime.fromisoformat(self.due_date)
-            return datetime.now() > due
-        except ValueError:
+        due = self.due_timestamp()
+        if due is None:
             return False
+        return (time.time() if now is None else now) > due
 
     def mark_done(self):
+        now = datetime.now().isoformat()
         self.status = "done"
-        self.completed_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.completed_at = now
+        self.updated_at = now
 
     def update_status(self, new_status: str):
-        valid = [s.value for s in TaskStatus]
-        if new_status not in valid:
-            raise ValueError(f"Invalid status '{new_status}'. Valid: {valid}")
+        if new_status not in _VALID_STATUS:
+            raise ValueError(f"Invalid status '{new_status}'. Valid: {_STATUS_VALUES}")
         old_status = self.status
+        now = datetime.now().isoformat()
         self.status = new_status
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = now
         if new_status == "done":
-            self.completed_at = datetime.now().isoformat()
+            self.completed_at = now
         return old_status
 
     def to_dict(self) -> dict:
-        return asdict(self)
-
-
-@dataclass
+        return {
+            "id": self.id,
+            "title": self.title,
+            "project_id": self.project_id,
+            "assignee_id": self.assignee_id,
+            "status": self.status,
+            "priority": self.priority,
+            "description": self.description,
+            "tags": list(self.tags),
+            "due_date": self.due_date,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "completed_at": self.completed_at,
+        }
+
+
+@dataclass(**_DATACLASS_OPTS)
 class Project:
     id: int
     name: str
@@ -123,10 +215,16 @@ class Project:
             self.created_at = datetime.now().isoformat()
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "owner_id": self.owner_id,
+            "description": self.description,
+            "created_at": self.created_at,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class EventLog:
     id: int
     event_type: str
@@ -141,10 +239,18 @@ class EventLog:
             self.timestamp = datetime.now().isoformat()
 
     def to_dict(self) -> dict:
-        return asdict(self)
-
-
-@dataclass
+        return {
+            "id": self.id,
+            "event_type": self.event_type,
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "user_id": self.user_id,
+            "timestamp": self.timestamp,
+            "details": dict(self.details),
+        }
+
+
+@dataclass(**_DATACLASS_OPTS)
 class Comment:
     id: int
     task_id: int
@@ -157,4 +263,10 @@ class Comment:
             self.created_at = datetime.now().isoformat()
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "task_id": self.task_id,
+            "user_id": self.user_id,
+            "text": self.text,
+            "created_at": self.created_at,
+        }
@@ -4,7 +4,7 @@ Task Manager CLI - Plugin system.
 Hook-based plugin architecture for extensibility.
 """
 
-from typing import Callable, List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Set
 
 
 class PluginHook:
@@ -13,23 +13,35 @@ class PluginHook:
     def __init__(self, name: str):
         self.name = name
         self._callbacks: List[Callable] = []
+        # Membership mirror of _callbacks; the list keeps firing order
+        self._callback_set: Set[Callable] = set()
 
     def register(self, callback: Callable):
         """Register a callback for this hook."""
-        if callback not in self._callbacks:
+        if callback not in self._callback_set:
+            self._callback_set.add(callback)
             self._callbacks.append(callback)
 
     def unregister(self, callback: Callable):
         """Unregister a callback."""
-        if callback in self._callbacks:
+        if callback in self._callback_set:
+            self._callback_set.discard(callback)
             self._callbacks.remove(callback)
 
     def fire(self, **kwargs) -> List[Any]:
         """Fire all registered callbacks with the given kwargs.
         Returns list of results from each callback.
         """
+        callbacks = self._callbacks
+        if not callbacks:
+            return []
+        if len(callbacks) == 1:
+            try:
+                return [callbacks[0](**kwargs)]
+            except Exception as e:
+                return [{"error": str(e)}]
         results = []
-        for cb in self._callbacks:
+        for cb in callbacks:
             try:
                 result = cb(**kwargs)
                 results.append(result)
@@ -85,6 +97,15 @@ class PluginManager:
         hook = self._hooks.get(hook_name)
         if hook is None:
             return []
+        # Most hooks have no plugins, or just one: skip the result loop
+        callbacks = hook._callbacks
+        if not callbacks:
+            return []
+        if len(callbacks) == 1:
+            try:
+                return [callbacks[0](**kwargs)]
+            except Exception as e:
+                return [{"error": str(e)}]
         return hook.fire(**kwargs)
 
     def list_hooks(self) -> List[str]:
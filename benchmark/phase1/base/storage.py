@@ -7,9 +7,15 @@ JSON file-based persistence for all entities.
 import json
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from typing import List, Optional, Dict, Any, Callable
 from models import User, Task, Project, EventLog, Comment
 
+try:
+    import orjson  # optional C-accelerated JSON codec
+except ImportError:
+    orjson = None
+
 
 DATA_DIR = Path("data")
 USERS_FILE = DATA_DIR / "users.json"
@@ -28,6 +34,9 @@ def _load_json(filepath: Path) -> list:
     """Load a JSON array from file."""
     if not filepath.exists():
         return []
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -35,10 +44,64 @@ def _load_json(filepath: Path) -> list:
 def _save_json(filepath: Path, data: list):
     """Save a JSON array to file."""
     ensure_data_dir()
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+# ---- Lookup indexes ----
+# Dicts built from a full load and reused while the backing file is
+# unchanged. Keyed by (path, mtime, size) so swapping the data directory or
+# an external write rebuilds them; save_* drops the affected entries.
+# They hold the stored records, not model objects: every lookup builds a
+# fresh object, so callers may mutate what they get without affecting
+# later lookups.
+
+_index_cache: Dict[str, tuple] = {}
+
+
+def _file_stamp(filepath: Path) -> tuple:
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        return (str(filepath), None, None)
+    return (str(filepath), st.st_mtime_ns, st.st_size)
+
+
+def _get_index(name: str, filepath: Path, build: Callable[[], dict]) -> dict:
+    """Return the cached index `name`, rebuilding it if filepath changed."""
+    stamp = _file_stamp(filepath)
+    cached = _index_cache.get(name)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    index = build()
+    _index_cache[name] = (stamp, index)
+    return index
+
+
+def _invalidate_indexes(*names: str):
+    for name in names:
+        _index_cache.pop(name, None)
+
+
+def _index_by_id(records: list) -> Dict[int, dict]:
+    """Map id -> record. If ids repeat the first record wins, as with a scan."""
+    index = {}
+    for r in records:
+        index.setdefault(r["id"], r)
+    return index
+
+
+def _group_by(records: list, key: str) -> Dict[Any, list]:
+    groups = defaultdict(list)
+    for r in records:
+        groups[r.get(key)].append(r)
+    return dict(groups)
+
+
 # ---- Users ----
 
 def load_users() -> List[User]:
@@ -48,13 +111,14 @@ def load_users() -> List[User]:
 
 def save_users(users: List[User]):
     _save_json(USERS_FILE, [u.to_dict() for u in users])
+    _invalidate_indexes("users_by_id")
 
 
 def get_user_by_id(user_id: int) -> Optional[User]:
-    for u in load_users():
-        if u.id == user_id:
-            return u
-    return None
+    index = _get_index("users_by_id", USERS_FILE,
+                       lambda: _index_by_id(_load_json(USERS_FILE)))
+    r = index.get(user_id)
+    return User(**r) if r is not None else None
 
 
 def get_next_user_id() -> int:
@@ -71,13 +135,14 @@ def load_projects() -> List[Project]:
 
 def save_projects(projects: List[Project]):
     _save_json(PROJECTS_FILE, [p.to_dict() for p in projects])
+    _invalidate_indexes("projects_by_id")
 
 
 def get_project_by_id(project_id: int) -> Optional[Project]:
-    for p in load_projects():
-        if p.id == project_id:
-            return p
-    return None
+    index = _get_index("projects_by_id", PROJECTS_FILE,
+                       lambda: _index_by_id(_load_json(PROJECTS_FILE)))
+    r = index.get(project_id)
+    return Project(**r) if r is not None else None
 
 
 def get_next_project_id() -> int:
@@ -89,26 +154,38 @@ def get_next_project_id() -> int:
 
 def load_tasks() -> List[Task]:
     raw = _load_json(TASKS_FILE)
-    return [Task(**r) for r in raw]
+    return [Task.from_dict(r) for r in raw]
+
+
+def _task_from_index(r: dict) -> Task:
+    """Build a task from a cached record without sharing its tag list."""
+    t = Task.from_dict(r)
+    t.tags = list(t.tags)
+    return t
 
 
 def save_tasks(tasks: List[Task]):
     _save_json(TASKS_FILE, [t.to_dict() for t in tasks])
+    _invalidate_indexes("tasks_by_id", "tasks_by_project", "tasks_by_assignee")
 
 
 def get_task_by_id(task_id: int) -> Optional[Task]:
-    for t in load_tasks():
-        if t.id == task_id:
-            return t
-    return None
+    index = _get_index("tasks_by_id", TASKS_FILE,
+                       lambda: _index_by_id(_load_json(TASKS_FILE)))
+    r = index.get(task_id)
+    return _task_from_index(r) if r is not None else None
 
 
 def get_tasks_by_project(project_id: int) -> List[Task]:
-    return [t for t in load_tasks() if t.project_id == project_id]
+    index = _get_index("tasks_by_project", TASKS_FILE,
+                       lambda: _group_by(_load_json(TASKS_FILE), "project_id"))
+    return [_task_from_index(r) for r in index.get(project_id, ())]
 
 
 def get_tasks_by_assignee(user_id: int) -> List[Task]:
-    return [t for t in load_tasks() if t.assignee_id == user_id]
+    index = _get_index("tasks_by_assignee", TASKS_FILE,
+                       lambda: _group_by(_load_json(TASKS_FILE), "assignee_id"))
+    return [_task_from_index(r) for r in index.get(user_id, ())]
 
 
 def get_next_task_id() -> int:
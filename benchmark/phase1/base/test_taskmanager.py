@@ -7,6 +7,7 @@ exporters, plugins, commands.
 
 import os
 import sys
+import copy
 import json
 import shutil
 import unittest
@@ -146,6 +147,21 @@ class TestStorage(BaseTestCase):
         self.assertEqual(storage.get_user_by_id(2).username, "bob")
         self.assertIsNone(storage.get_user_by_id(99))
 
+    def test_lookups_return_independent_objects(self):
+        storage.save_tasks([
+            models.Task(id=1, title="A", project_id=1, tags=["x"]),
+            models.Task(id=1, title="Duplicate", project_id=1),
+        ])
+        task = storage.get_task_by_id(1)
+        self.assertEqual(task.title, "A")
+        task.title = "MUTATED"
+        task.tags.append("y")
+        storage.get_tasks_by_project(1)[0].title = "MUTATED"
+        again = storage.get_task_by_id(1)
+        self.assertEqual((again.title, again.tags), ("A", ["x"]))
+        self.assertEqual(storage.get_tasks_by_project(1)[0].title, "A")
+        self.assertEqual(storage.load_tasks()[0].title, "A")
+
     def test_save_and_load_tasks(self):
         tasks = [
             models.Task(id=1, title="Task A", project_id=1),
@@ -204,10 +220,12 @@ class TestStorage(BaseTestCase):
 
 class TestFilters(BaseTestCase):
 
-    def _make_tasks(self):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
         yesterday = (datetime.now() - timedelta(days=1)).isoformat()
         tomorrow = (datetime.now() + timedelta(days=1)).isoformat()
-        return [
+        cls._template_tasks = [
             models.Task(id=1, title="Bug fix", project_id=1, status="todo",
                          priority="high", tags=["bug"], assignee_id=1,
                          due_date=yesterday),
@@ -221,6 +239,9 @@ class TestFilters(BaseTestCase):
                          priority="critical", tags=["bug", "urgent"], assignee_id=1),
         ]
 
+    def _make_tasks(self):
+        return copy.deepcopy(self._template_tasks)
+
     def test_filter_by_status(self):
         tasks = self._make_tasks()
         result = filters.filter_by_status(tasks, "todo")
@@ -351,13 +372,18 @@ class TestValidators(BaseTestCase):
 
 class TestExporters(BaseTestCase):
 
-    def _make_tasks(self):
-        return [
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._template_tasks = [
             models.Task(id=1, title="A", project_id=1, tags=["bug"]),
             models.Task(id=2, title="B", project_id=1, status="done",
                          completed_at=datetime.now().isoformat()),
         ]
 
+    def _make_tasks(self):
+        return copy.deepcopy(self._template_tasks)
+
     def test_export_csv(self):
         tasks = self._make_tasks()
         filepath = os.path.join(self.test_dir, "out.csv")
@@ -449,6 +475,16 @@ class TestFormatters(BaseTestCase):
         self.assertIn("Bug", line)
         self.assertIn("!!", line)
 
+    def test_format_task_line_after_tag_change(self):
+        t = models.Task(id=1, title="Bug", project_id=1, tags=["a"])
+        self.assertTrue(formatters.format_task_line(t).endswith(" #a"))
+        t.tags = ["b", "c"]
+        self.assertTrue(formatters.format_task_line(t).endswith(" #b #c"))
+        t.tags.append("d")
+        self.assertTrue(formatters.format_task_line(t).endswith(" #b #c #d"))
+        t.tags = []
+        self.assertNotIn("#b", formatters.format_task_line(t))
+
     def test_format_task_detail(self):
         t = models.Task(id=1, title="Bug", project_id=1, description="Fix it")
         detail = formatters.format_task_detail(t)
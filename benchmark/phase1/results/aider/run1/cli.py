@@ -5,6 +5,7 @@ Usage: python cli.py <command> [options]
 """
 
 import sys
+import json
 import argparse
 from commands import (
     cmd_init, cmd_add_user, cmd_list_users,
@@ -14,7 +15,7 @@ from commands import (
     cmd_add_comment, cmd_export, cmd_summary,
     cmd_add_recurring, cmd_list_recurring, cmd_run_recurring, cmd_cancel_recurring,
     cmd_add_dependency, cmd_list_dependencies, cmd_remove_dependency,
-    cmd_dashboard,
+    cmd_dashboard, cmd_batch,
 )
 
 
@@ -146,6 +147,11 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--days", type=int, default=7)
     p.add_argument("--user", type=int, default=None)
 
+    # batch
+    p = sub.add_parser("batch", help="Run several commands from a JSON list")
+    p.add_argument("file", nargs="?", type=argparse.FileType("r"), default=sys.stdin,
+                   help='JSON list of {"command": name, ...arguments} (default: stdin)')
+
     return parser
 
 
@@ -240,6 +246,19 @@ def main():
         cmd_remove_dependency(args.task_id, args.depends_on)
     elif args.command == "dashboard":
         cmd_dashboard(days=args.days, user_id=args.user)
+    elif args.command == "batch":
+        try:
+            with args.file as f:
+                entries = json.load(f)
+        except ValueError as e:
+            print(f"Error: Invalid batch file: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not isinstance(entries, list) or not all(isinstance(e, dict) for e in entries):
+            print("Error: Batch file must hold a JSON list of objects", file=sys.stderr)
+            sys.exit(1)
+        # Commands that only print return None; False marks a failure
+        if any(r is False for r in cmd_batch(entries)):
+            sys.exit(1)
     else:
         parser.print_help()
         sys.exit(1)
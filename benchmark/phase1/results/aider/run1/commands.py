@@ -6,10 +6,13 @@ All CLI command handlers.
 
 import sys
 import json
+import inspect
+from collections import Counter
+from datetime import datetime, timedelta
 from typing import List, Optional
 from models import Task, Project, User, Comment, RecurringRule, TaskDependency
 from storage import (
-    load_tasks, save_tasks, get_task_by_id, get_next_task_id,
+    load_tasks, save_tasks, get_task_by_id, get_next_task_id, find_by_id,
     load_projects, save_projects, get_project_by_id, get_next_project_id,
     load_users, save_users, get_user_by_id, get_next_user_id,
     load_comments, save_comments, get_next_comment_id,
@@ -17,6 +20,7 @@ from storage import (
     get_events_for_entity, add_event, ensure_data_dir,
     load_recurring_rules, save_recurring_rules, get_recurring_rule_by_id, get_next_recurring_id,
     load_dependencies, save_dependencies, get_dependencies_for_task, get_dependents_of_task, get_next_dependency_id,
+    get_dependency_adjacency,
 )
 from filters import apply_filters
 from formatters import (
@@ -67,8 +71,7 @@ def cmd_list_users(**kwargs):
     if not users:
         print("No users found.")
         return
-    for u in users:
-        print(format_user_line(u))
+    print("\n".join(format_user_line(u) for u in users))
 
 
 def cmd_add_project(name: str, owner_id: int, description: str = "", **kwargs):
@@ -102,9 +105,9 @@ def cmd_list_projects(**kwargs):
     if not projects:
         print("No projects found.")
         return
-    for p in projects:
-        task_count = len(get_tasks_by_project(p.id))
-        print(format_project_line(p, task_count))
+    # One load of tasks.json for all the counts, one write for all the lines
+    counts = Counter(t.project_id for t in load_tasks())
+    print("\n".join(format_project_line(p, counts[p.id]) for p in projects))
 
 
 def cmd_show_project(project_id: int, **kwargs):
@@ -175,8 +178,7 @@ def cmd_list_tasks(filters: Optional[dict] = None, format: str = "lines", **kwar
     if format == "table":
         print(format_task_table(tasks))
     else:
-        for t in tasks:
-            print(format_task_line(t, show_project=True))
+        print("\n".join(format_task_line(t, show_project=True) for t in tasks))
 
 
 def cmd_show_task(task_id: int, **kwargs):
@@ -194,11 +196,7 @@ def cmd_show_task(task_id: int, **kwargs):
 def cmd_update_task(task_id: int, **updates):
     """Update task fields."""
     tasks = load_tasks()
-    task = None
-    for t in tasks:
-        if t.id == task_id:
-            task = t
-            break
+    task = find_by_id(tasks, task_id)
 
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
@@ -224,10 +222,13 @@ def cmd_update_task(task_id: int, **updates):
         if updates["status"] == "done":
             deps = get_dependencies_for_task(task_id)
             incomplete_deps = []
-            for d in deps:
-                dep_task = get_task_by_id(d.depends_on_id)
-                if dep_task and dep_task.status != "done":
-                    incomplete_deps.append(dep_task)
+            if deps:
+                # Resolve against the tasks already loaded above
+                by_id = {t.id: t for t in tasks}
+                for d in deps:
+                    dep_task = by_id.get(d.depends_on_id)
+                    if dep_task and dep_task.status != "done":
+                        incomplete_deps.append(dep_task)
             if incomplete_deps:
                 print(f"WARNING: Task #{task_id} depends on incomplete tasks:", file=sys.stderr)
                 for dt in incomplete_deps:
@@ -257,7 +258,6 @@ def cmd_update_task(task_id: int, **updates):
         changed["description"] = (task.description, updates["description"])
         task.description = updates["description"]
 
-    from datetime import datetime
     task.updated_at = datetime.now().isoformat()
     save_tasks(tasks)
 
@@ -274,11 +274,7 @@ def cmd_update_task(task_id: int, **updates):
 def cmd_delete_task(task_id: int, user_id: int = 0, **kwargs):
     """Delete a task."""
     tasks = load_tasks()
-    task = None
-    for t in tasks:
-        if t.id == task_id:
-            task = t
-            break
+    task = find_by_id(tasks, task_id)
 
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
@@ -290,10 +286,12 @@ def cmd_delete_task(task_id: int, user_id: int = 0, **kwargs):
     tasks = [t for t in tasks if t.id != task_id]
     save_tasks(tasks)
 
-    # Remove all dependencies involving this task
+    # Remove all dependencies involving this task; most tasks have none,
+    # so leave the file alone unless something was dropped
     deps = load_dependencies()
-    deps = [d for d in deps if d.task_id != task_id and d.depends_on_id != task_id]
-    save_dependencies(deps)
+    kept = [d for d in deps if d.task_id != task_id and d.depends_on_id != task_id]
+    if len(kept) != len(deps):
+        save_dependencies(kept)
 
     add_event("task_deleted", "task", task_id, user_id,
               {"title": task.title, "project_id": task.project_id})
@@ -380,7 +378,6 @@ def cmd_add_recurring(task_id: int, frequency: str, end_date: Optional[str] = No
         print(f"Error: Invalid frequency '{frequency}'. Valid: {', '.join(valid_frequencies)}", file=sys.stderr)
         return False
 
-    from datetime import datetime
     next_run = datetime.now().isoformat()
 
     rules = load_recurring_rules()
@@ -405,40 +402,49 @@ def cmd_list_recurring(**kwargs):
         print("No recurring rules found.")
         return
 
+    lines = []
     for r in rules:
         status = "active" if r.active else "inactive"
         end = f" until {r.end_date}" if r.end_date else ""
-        print(f"Rule #{r.id}: template=#{r.task_template_id}, {r.frequency}, next={r.next_run[:10]}, created={r.created_count}, {status}{end}")
+        lines.append(f"Rule #{r.id}: template=#{r.task_template_id}, {r.frequency}, "
+                     f"next={r.next_run[:10]}, created={r.created_count}, {status}{end}")
+    print("\n".join(lines))
 
 
 def cmd_run_recurring(user_id: int, **kwargs):
     """Check all active rules and create tasks for those that should run."""
     rules = load_recurring_rules()
     tasks = load_tasks()
+    by_id = {t.id: t for t in tasks}
+    next_id = max(by_id, default=0) + 1
     created_count = 0
+    now = datetime.now()
 
     # Fire pre-run hook
     plugin_manager.fire("recurring_pre_run", user_id=user_id)
 
     for rule in rules:
-        if rule.should_run():
+        # Cancelled rules are skipped before should_run parses any dates
+        if rule.active and rule.should_run(now):
             # Get template task
-            template = get_task_by_id(rule.task_template_id)
+            template = by_id.get(rule.task_template_id)
             if not template:
                 continue
 
             # Create new task from template
             new_task = Task(
-                id=get_next_task_id(),
+                id=next_id,
                 title=template.title,
                 project_id=template.project_id,
                 assignee_id=template.assignee_id,
                 priority=template.priority,
                 description=template.description,
-                tags=template.tags.copy(),
+                # Shared with the template: both are only serialised below
+                tags=template.tags,
                 due_date=template.due_date,
             )
             tasks.append(new_task)
+            next_id += 1
             created_count += 1
 
             # Advance the rule
@@ -457,11 +463,7 @@ def cmd_run_recurring(user_id: int, **kwargs):
 def cmd_cancel_recurring(rule_id: int, **kwargs):
     """Deactivate a recurring rule."""
     rules = load_recurring_rules()
-    rule = None
-    for r in rules:
-        if r.id == rule_id:
-            rule = r
-            break
+    rule = find_by_id(rules, rule_id)
 
     if not rule:
         print(f"Error: Recurring rule #{rule_id} not found", file=sys.stderr)
@@ -490,14 +492,15 @@ def cmd_add_dependency(task_id: int, depends_on_id: int, **kwargs):
         return False
 
     deps = load_dependencies()
+    graph = get_dependency_adjacency()
 
     # Check for duplicate
-    if any(d.task_id == task_id and d.depends_on_id == depends_on_id for d in deps):
+    if depends_on_id in graph.get(task_id, ()):
         print(f"Error: Dependency already exists", file=sys.stderr)
         return False
 
     # Check for circular dependency
-    ok, msg = validate_no_circular_dependency(task_id, depends_on_id, deps)
+    ok, msg = validate_no_circular_dependency(task_id, depends_on_id, deps, graph=graph)
     if not ok:
         print(f"Error: {msg}", file=sys.stderr)
         return False
@@ -563,7 +566,6 @@ def cmd_remove_dependency(task_id: int, depends_on_id: int, **kwargs):
 
 def cmd_dashboard(days: int = 7, user_id: Optional[int] = None, **kwargs):
     """Show activity dashboard."""
-    from datetime import datetime, timedelta
     tasks = load_tasks()
     now = datetime.now()
     start_date = now - timedelta(days=days)
@@ -572,69 +574,65 @@ def cmd_dashboard(days: int = 7, user_id: Optional[int] = None, **kwargs):
     if user_id:
         tasks = [t for t in tasks if t.assignee_id == user_id]
 
-    # Tasks created in period
-    created_in_period = []
+    # One pass over the tasks. Activity is counted separately for created
+    # and completed tasks and merged afterwards, so ties for most active
+    # user / busiest project resolve in the same order as before.
+    created_count = 0
+    completed_count = 0
+    completion_times = []
+    created_users, created_projects = {}, {}
+    completed_users, completed_projects = {}, {}
+    overdue_count = 0
+    by_status = {}
     for t in tasks:
+        uid = t.assignee_id or 0
+        pid = t.project_id
         try:
             created = datetime.fromisoformat(t.created_at)
-            if created >= start_date:
-                created_in_period.append(t)
         except ValueError:
-            pass
+            created = None
+        if created is not None and created >= start_date:
+            created_count += 1
+            created_users[uid] = created_users.get(uid, 0) + 1
+            created_projects[pid] = created_projects.get(pid, 0) + 1
 
-    # Tasks completed in period
-    completed_in_period = []
-    for t in tasks:
         if t.completed_at:
             try:
                 completed = datetime.fromisoformat(t.completed_at)
-                if completed >= start_date:
-                    completed_in_period.append(t)
             except ValueError:
-                pass
+                completed = None
+            if completed is not None and completed >= start_date:
+                completed_count += 1
+                completed_users[uid] = completed_users.get(uid, 0) + 1
+                completed_projects[pid] = completed_projects.get(pid, 0) + 1
+                if created is not None:
+                    completion_times.append((completed - created).total_seconds() / 3600)  # hours
+
+        if t.is_overdue():
+            overdue_count += 1
+        by_status[t.status] = by_status.get(t.status, 0) + 1
 
     # Completion rate
-    total_in_period = len(created_in_period)
-    completed_count = len(completed_in_period)
-    completion_rate = (completed_count / total_in_period * 100) if total_in_period > 0 else 0
+    completion_rate = (completed_count / created_count * 100) if created_count > 0 else 0
 
     # Average completion time
-    completion_times = []
-    for t in completed_in_period:
-        try:
-            created = datetime.fromisoformat(t.created_at)
-            completed = datetime.fromisoformat(t.completed_at)
-            delta = completed - created
-            completion_times.append(delta.total_seconds() / 3600)  # hours
-        except ValueError:
-            pass
     avg_completion_time = sum(completion_times) / len(completion_times) if completion_times else 0
 
     # Most active user
-    user_activity = {}
-    for t in created_in_period + completed_in_period:
-        uid = t.assignee_id or 0
-        user_activity[uid] = user_activity.get(uid, 0) + 1
+    user_activity = created_users
+    for uid, n in completed_users.items():
+        user_activity[uid] = user_activity.get(uid, 0) + n
     most_active_user = max(user_activity.items(), key=lambda x: x[1])[0] if user_activity else None
 
     # Busiest project
-    project_activity = {}
-    for t in created_in_period + completed_in_period:
-        pid = t.project_id
-        project_activity[pid] = project_activity.get(pid, 0) + 1
+    project_activity = created_projects
+    for pid, n in completed_projects.items():
+        project_activity[pid] = project_activity.get(pid, 0) + n
     busiest_project = max(project_activity.items(), key=lambda x: x[1])[0] if project_activity else None
 
-    # Overdue tasks
-    overdue_count = sum(1 for t in tasks if t.is_overdue())
-
-    # Tasks by status
-    by_status = {}
-    for t in tasks:
-        by_status[t.status] = by_status.get(t.status, 0) + 1
-
     data = {
         "days": days,
-        "created": len(created_in_period),
+        "created": created_count,
         "completed": completed_count,
         "completion_rate": completion_rate,
         "avg_completion_time": avg_completion_time,
@@ -647,3 +645,85 @@ def cmd_dashboard(days: int = 7, user_id: Optional[int] = None, **kwargs):
     from formatters import format_dashboard
     print(format_dashboard(data))
     return True
+
+
+# Commands cmd_batch may run, by the name used in batch entries
+BATCH_COMMANDS = {
+    "init": cmd_init,
+    "add_user": cmd_add_user,
+    "list_users": cmd_list_users,
+    "add_project": cmd_add_project,
+    "list_projects": cmd_list_projects,
+    "show_project": cmd_show_project,
+    "add_task": cmd_add_task,
+    "list_tasks": cmd_list_tasks,
+    "show_task": cmd_show_task,
+    "update_task": cmd_update_task,
+    "delete_task": cmd_delete_task,
+    "add_comment": cmd_add_comment,
+    "export": cmd_export,
+    "summary": cmd_summary,
+    "add_recurring": cmd_add_recurring,
+    "list_recurring": cmd_list_recurring,
+    "run_recurring": cmd_run_recurring,
+    "cancel_recurring": cmd_cancel_recurring,
+    "add_dependency": cmd_add_dependency,
+    "list_dependencies": cmd_list_dependencies,
+    "remove_dependency": cmd_remove_dependency,
+    "dashboard": cmd_dashboard,
+}
+
+# Keys accepted through a command's **kwargs, beyond its named parameters
+BATCH_EXTRA_KEYS = {
+    "update_task": {"title", "status", "priority", "assignee_id", "due_date",
+                    "tags", "description"},
+}
+
+
+def cmd_batch(commands: List[dict], **kwargs):
+    """Run several commands in one process, in order.
+
+    Each entry names a command from BATCH_COMMANDS plus its keyword
+    arguments, e.g. ``{"command": "add_task", "title": "X", "project_id": 1}``.
+    Commands share the storage caches, so later ones skip re-parsing files
+    earlier ones only read. Returns each command's result.
+    """
+    results = []
+    for entry in commands:
+        entry = dict(entry)
+        name = entry.pop("command", "")
+        handler = BATCH_COMMANDS.get(name)
+        if handler is None:
+            print(f"Error: Unknown command '{name}'", file=sys.stderr)
+            results.append(False)
+            continue
+        error = _check_batch_args(handler, entry, BATCH_EXTRA_KEYS.get(name, ()))
+        if error:
+            print(f"Error: Bad arguments for '{name}': {error}", file=sys.stderr)
+            results.append(False)
+            continue
+        try:
+            results.append(handler(**entry))
+        except Exception as e:
+            # One failing entry must not abort the rest of the batch
+            print(f"Error: '{name}' failed: {e}", file=sys.stderr)
+            results.append(False)
+    return results
+
+
+def _check_batch_args(handler, entry: dict, extra_keys=()) -> Optional[str]:
+    """Describe what is wrong with entry as arguments to handler, if anything.
+
+    Handlers take **kwargs, so binding alone would accept any misspelt key;
+    keys are checked against the named parameters plus extra_keys instead.
+    """
+    params = [p for p in inspect.signature(handler).parameters.values()
+              if p.kind not in (p.VAR_KEYWORD, p.VAR_POSITIONAL)]
+    names = {p.name for p in params}.union(extra_keys)
+    unknown = sorted(k for k in entry if k not in names)
+    if unknown:
+        return "unexpected " + ", ".join(unknown)
+    missing = [p.name for p in params if p.default is p.empty and p.name not in entry]
+    if missing:
+        return "missing " + ", ".join(missing)
+    return None
@@ -86,7 +86,10 @@ class PluginManager:
     def fire(self, hook_name: str, **kwargs) -> List[Any]:
         """Fire a named hook."""
         hook = self._hooks.get(hook_name)
-        if hook is None:
+        # Most hooks have no subscribers: skip the call into PluginHook.fire.
+        # Checking the hook's own list (not a separate "active" set) stays
+        # correct for callbacks registered through get_hook() directly.
+        if hook is None or not hook._callbacks:
             return []
         return hook.fire(**kwargs)
 
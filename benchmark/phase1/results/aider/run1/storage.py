@@ -5,11 +5,17 @@ JSON file-based persistence for all entities.
 """
 
 import json
+import marshal
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from models import User, Task, Project, EventLog, Comment, RecurringRule, TaskDependency
 
+try:
+    import orjson  # optional C-accelerated JSON codec
+except ImportError:
+    orjson = None
+
 
 DATA_DIR = Path("data")
 USERS_FILE = DATA_DIR / "users.json"
@@ -26,19 +32,206 @@ def ensure_data_dir():
     DATA_DIR.mkdir(exist_ok=True)
 
 
+# ---- Backends ----
+# Every load_*/save_* goes through _load_json/_save_json, which delegate to
+# the active backend (FileBackend unless use_backend swapped in another with
+# the same methods). A backend hands out an independent copy per load.
+# Append-only logs (events) are stored one JSON object per line and grow
+# through _append_json_lines instead of being rewritten.
+
+def _json_line(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _decode(raw: bytes) -> list:
+    """Parse a JSON array, or a file holding one JSON object per line."""
+    if raw.lstrip()[:1] == b"[":
+        return _loads(raw)
+    return [_loads(line) for line in raw.splitlines() if line.strip()]
+
+
+class FileBackend:
+    """JSON files on disk (the default)."""
+
+    def __init__(self):
+        # Parsed contents keyed by path, stored with the file's (mtime, size)
+        # and marshalled: a hit skips the read and the JSON parse.
+        self._cache: Dict[str, tuple] = {}
+
+    def stamp(self, filepath: Path):
+        """Version of the stored data; None if there is none."""
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def load(self, filepath: Path) -> list:
+        stamp = self.stamp(filepath)
+        if stamp is None:
+            return []
+        key = str(filepath)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return marshal.loads(cached[1])
+        with open(filepath, "rb") as f:
+            data = _decode(f.read())
+        self._cache[key] = (stamp, marshal.dumps(data))
+        return data
+
+    def _replace(self, filepath: Path, payload: bytes):
+        """Write payload to a temp file and rename it over filepath, so
+        readers see either the old or the new contents, never a partial
+        write."""
+        ensure_data_dir()
+        self._cache.pop(str(filepath), None)
+        tmp = filepath.with_name(filepath.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, filepath)
+
+    def save(self, filepath: Path, data: list):
+        if orjson is not None:
+            # Same layout as json.dumps(indent=2, ensure_ascii=False)
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        self._replace(filepath, payload)
+
+    def save_lines(self, filepath: Path, data: list):
+        self._replace(filepath, b"".join(_json_line(r) for r in data))
+
+    def last_line(self, filepath: Path) -> Optional[dict]:
+        """Return the last record of a JSON-lines file, reading only its tail.
+
+        None for a missing or empty file; ValueError for a JSON array.
+        """
+        try:
+            f = open(filepath, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            if f.read(1) == b"[":
+                raise ValueError(f"{filepath} is a JSON array, not JSON lines")
+            end = f.seek(0, os.SEEK_END)
+            block = 4096
+            while True:
+                start = max(0, end - block)
+                f.seek(start)
+                lines = [line for line in f.read().split(b"\n") if line.strip()]
+                # With the first line possibly cut off, only trust it at offset 0
+                if len(lines) > 1 or (lines and start == 0):
+                    return _loads(lines[-1])
+                if start == 0:
+                    return None
+                block *= 2
+
+    def append_lines(self, filepath: Path, records: list):
+        ensure_data_dir()
+        with open(filepath, "ab+") as f:
+            f.seek(0)
+            legacy = f.read(1) == b"["
+        if legacy:
+            # A log written as a JSON array: convert it once, then append
+            self.save_lines(filepath, self.load(filepath) + records)
+            return
+        self._cache.pop(str(filepath), None)
+        with open(filepath, "ab") as f:
+            f.write(b"".join(_json_line(r) for r in records))
+
+
+_backend = FileBackend()
+
+
+def use_backend(backend):
+    """Route every load and save through backend and return it."""
+    global _backend
+    _backend = backend
+    return _backend
+
+
+def use_file_backend() -> FileBackend:
+    """Switch storage back to the on-disk JSON files."""
+    global _backend
+    _backend = FileBackend()
+    return _backend
+
+
 def _load_json(filepath: Path) -> list:
     """Load a JSON array from file."""
-    if not filepath.exists():
-        return []
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _backend.load(filepath)
 
 
 def _save_json(filepath: Path, data: list):
     """Save a JSON array to file."""
-    ensure_data_dir()
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _invalidate_derived(filepath)
+    _backend.save(filepath, data)
+
+
+def _invalidate_derived(filepath: Path):
+    key = str(filepath)
+    for cached in [k for k in _derived_cache if k[1] == key]:
+        del _derived_cache[cached]
+
+
+def _save_json_lines(filepath: Path, data: list):
+    """Rewrite an append-only log."""
+    _invalidate_derived(filepath)
+    _backend.save_lines(filepath, data)
+
+
+def _append_json_lines(filepath: Path, records: list):
+    """Append records to a log without rewriting what is already there."""
+    _invalidate_derived(filepath)
+    _backend.append_lines(filepath, records)
+
+
+# ---- Derived lookups ----
+# Structures built from a full load (id indexes, the dependency graph) and
+# reused until the file's (mtime, size) changes. The id indexes hold
+# marshalled records and every lookup builds a new object, so callers may
+# mutate what they get; other derived structures are shared between callers
+# and read-only.
+
+_derived_cache: Dict[tuple, tuple] = {}
+
+
+def _get_derived(name: str, filepath: Path, build: Callable[[], Any]):
+    """Return the cached structure `name` for filepath, rebuilding if stale."""
+    stamp = _backend.stamp(filepath)
+    key = (name, str(filepath))
+    cached = _derived_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = build()
+    _derived_cache[key] = (stamp, value)
+    return value
+
+
+def _set_derived(name: str, filepath: Path, value):
+    """Record `value` as current for the file's present contents."""
+    _derived_cache[(name, str(filepath))] = (_backend.stamp(filepath), value)
+
+
+def _find_record(filepath: Path, item_id: int) -> Optional[dict]:
+    """Return a fresh copy of the stored record with the given id, if any."""
+    def build():
+        index = {}
+        for r in _load_json(filepath):
+            index.setdefault(r["id"], r)  # first record wins, as in a scan
+        return {k: marshal.dumps(r) for k, r in index.items()}
+    raw = _get_derived("by_id", filepath, build).get(item_id)
+    return marshal.loads(raw) if raw is not None else None
+
+
+def find_by_id(items: list, item_id: int):
+    """Return the first item in an already-loaded list with the given id."""
+    return next((x for x in items if x.id == item_id), None)
 
 
 # ---- Users ----
@@ -53,10 +246,8 @@ def save_users(users: List[User]):
 
 
 def get_user_by_id(user_id: int) -> Optional[User]:
-    for u in load_users():
-        if u.id == user_id:
-            return u
-    return None
+    r = _find_record(USERS_FILE, user_id)
+    return User(**r) if r is not None else None
 
 
 def get_next_user_id() -> int:
@@ -76,10 +267,8 @@ def save_projects(projects: List[Project]):
 
 
 def get_project_by_id(project_id: int) -> Optional[Project]:
-    for p in load_projects():
-        if p.id == project_id:
-            return p
-    return None
+    r = _find_record(PROJECTS_FILE, project_id)
+    return Project(**r) if r is not None else None
 
 
 def get_next_project_id() -> int:
@@ -99,10 +288,8 @@ def save_tasks(tasks: List[Task]):
 
 
 def get_task_by_id(task_id: int) -> Optional[Task]:
-    for t in load_tasks():
-        if t.id == task_id:
-            return t
-    return None
+    r = _find_record(TASKS_FILE, task_id)
+    return Task(**r) if r is not None else None
 
 
 def get_tasks_by_project(project_id: int) -> List[Task]:
@@ -126,25 +313,52 @@ def load_events() -> List[EventLog]:
 
 
 def save_events(events: List[EventLog]):
-    _save_json(EVENTS_FILE, [e.to_dict() for e in events])
+    _save_json_lines(EVENTS_FILE, [e.to_dict() for e in events])
 
 
 def add_event(event_type: str, entity_type: str, entity_id: int,
               user_id: int, details: Dict[str, Any] = None):
     """Append a single event to the log."""
-    events = load_events()
-    new_id = max((e.id for e in events), default=0) + 1
-    event = EventLog(
-        id=new_id,
-        event_type=event_type,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        user_id=user_id,
-        details=details or {},
-    )
-    events.append(event)
-    save_events(events)
-    return event
+    return add_events([(event_type, entity_type, entity_id, user_id, details)])[0]
+
+
+def _next_event_id() -> int:
+    """Id for the next event: one past the last record in the log.
+
+    Only the log's tail is read. A log still stored as a JSON array is
+    parsed in full; the append that follows converts it to lines.
+    """
+    try:
+        last = _backend.last_line(EVENTS_FILE)
+    except ValueError:
+        return max((e.id for e in load_events()), default=0) + 1
+    return last["id"] + 1 if last else 1
+
+
+def add_events(entries: List[tuple]) -> List[EventLog]:
+    """Append several events to the log with a single write.
+
+    Each entry is an (event_type, entity_type, entity_id, user_id, details)
+    tuple, as taken by add_event.
+    """
+    if not entries:
+        return []
+    next_id = _get_derived("next_id", EVENTS_FILE, _next_event_id)
+    added = []
+    for event_type, entity_type, entity_id, user_id, details in entries:
+        event = EventLog(
+            id=next_id,
+            event_type=event_type,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            user_id=user_id,
+            details=details or {},
+        )
+        added.append(event)
+        next_id += 1
+    _append_json_lines(EVENTS_FILE, [e.to_dict() for e in added])
+    _set_derived("next_id", EVENTS_FILE, next_id)
+    return added
 
 
 def get_events_for_entity(entity_type: str, entity_id: int) -> List[EventLog]:
@@ -184,10 +398,8 @@ def save_recurring_rules(rules: List[RecurringRule]):
 
 
 def get_recurring_rule_by_id(rule_id: int) -> Optional[RecurringRule]:
-    for r in load_recurring_rules():
-        if r.id == rule_id:
-            return r
-    return None
+    r = _find_record(RECURRING_FILE, rule_id)
+    return RecurringRule(**r) if r is not None else None
 
 
 def get_next_recurring_id() -> int:
@@ -216,6 +428,16 @@ def get_dependents_of_task(task_id: int) -> List[TaskDependency]:
     return [d for d in load_dependencies() if d.depends_on_id == task_id]
 
 
+def get_dependency_adjacency() -> Dict[int, List[int]]:
+    """Map each task id to the ids it depends on (shared; do not modify)."""
+    def build():
+        adj = {}
+        for d in load_dependencies():
+            adj.setdefault(d.task_id, []).append(d.depends_on_id)
+        return adj
+    return _get_derived("adjacency", DEPENDENCIES_FILE, build)
+
+
 def get_next_dependency_id() -> int:
     deps = load_dependencies()
     return max((d.id for d in deps), default=0) + 1
@@ -7,7 +7,11 @@ exporters, plugins, commands.
 
 import os
 import sys
+import io
 import json
+import contextlib
+import itertools
+import marshal
 import shutil
 import unittest
 import tempfile
@@ -27,6 +31,38 @@ import plugins
 import commands
 
 
+class MemoryBackend:
+    """Storage backend keeping each file's contents in RAM, so tests skip
+    the disk; select it with storage.use_backend(MemoryBackend())."""
+
+    _versions = itertools.count(1)  # shared so stamps never repeat
+
+    def __init__(self):
+        self._files = {}
+
+    def stamp(self, filepath):
+        entry = self._files.get(str(filepath))
+        return ("mem", entry[0]) if entry is not None else None
+
+    def load(self, filepath):
+        entry = self._files.get(str(filepath))
+        return marshal.loads(entry[1]) if entry is not None else []
+
+    def save(self, filepath, data):
+        # Round-trip through JSON so loads see exactly what a file would hold
+        data = json.loads(json.dumps(data, ensure_ascii=False))
+        self._files[str(filepath)] = (next(self._versions), marshal.dumps(data))
+
+    save_lines = save
+
+    def last_line(self, filepath):
+        data = self.load(filepath)
+        return data[-1] if data else None
+
+    def append_lines(self, filepath, records):
+        self.save(filepath, self.load(filepath) + records)
+
+
 class BaseTestCase(unittest.TestCase):
     """Base test with temp data directory setup/teardown."""
 
@@ -39,9 +75,24 @@ class BaseTestCase(unittest.TestCase):
         storage.TASKS_FILE = storage.DATA_DIR / "tasks.json"
         storage.EVENTS_FILE = storage.DATA_DIR / "events.json"
         storage.COMMENTS_FILE = storage.DATA_DIR / "comments.json"
+        storage.RECURRING_FILE = storage.DATA_DIR / "recurring.json"
+        storage.DEPENDENCIES_FILE = storage.DATA_DIR / "dependencies.json"
         storage.ensure_data_dir()
+        storage.use_backend(MemoryBackend())
+
+    @contextlib.contextmanager
+    def capture(self, stream: str = "stdout"):
+        """Temporarily replace sys.stdout (or sys.stderr) with a StringIO."""
+        buf = io.StringIO()
+        old = getattr(sys, stream)
+        setattr(sys, stream, buf)
+        try:
+            yield buf
+        finally:
+            setattr(sys, stream, old)
 
     def tearDown(self):
+        storage.use_file_backend()
         shutil.rmtree(self.test_dir, ignore_errors=True)
         storage.DATA_DIR = self.orig_data_dir
         storage.USERS_FILE = storage.DATA_DIR / "users.json"
@@ -49,6 +100,8 @@ class BaseTestCase(unittest.TestCase):
         storage.TASKS_FILE = storage.DATA_DIR / "tasks.json"
         storage.EVENTS_FILE = storage.DATA_DIR / "events.json"
         storage.COMMENTS_FILE = storage.DATA_DIR / "comments.json"
+        storage.RECURRING_FILE = storage.DATA_DIR / "recurring.json"
+        storage.DEPENDENCIES_FILE = storage.DATA_DIR / "dependencies.json"
 
 
 # ====================================================================
@@ -130,6 +183,11 @@ class TestModels(BaseTestCase):
 
 class TestStorage(BaseTestCase):
 
+    def setUp(self):
+        super().setUp()
+        # Exercise the real JSON files here; other tests run in memory
+        storage.use_file_backend()
+
     def test_save_and_load_users(self):
         users = [models.User(id=1, username="alice", email="a@t.com")]
         storage.save_users(users)
@@ -146,6 +204,17 @@ class TestStorage(BaseTestCase):
         self.assertEqual(storage.get_user_by_id(2).username, "bob")
         self.assertIsNone(storage.get_user_by_id(99))
 
+    def test_get_task_by_id_returns_independent_objects(self):
+        storage.save_tasks([models.Task(id=1, title="A", project_id=1, tags=["x"]),
+                            models.Task(id=1, title="Duplicate", project_id=1)])
+        task = storage.get_task_by_id(1)
+        self.assertEqual(task.title, "A")
+        task.title = "MUTATED"
+        task.tags.append("y")
+        again = storage.get_task_by_id(1)
+        self.assertEqual((again.title, again.tags), ("A", ["x"]))
+        self.assertEqual(storage.load_tasks()[0].title, "A")
+
     def test_save_and_load_tasks(self):
         tasks = [
             models.Task(id=1, title="Task A", project_id=1),
@@ -182,6 +251,47 @@ class TestStorage(BaseTestCase):
         events = storage.load_events()
         self.assertEqual(len(events), 1)
 
+    def test_add_event_appends_lines(self):
+        storage.use_file_backend()
+        storage.add_event("task_created", "task", 1, 1)
+        storage.add_event("task_updated", "task", 1, 1, {"status": "done"})
+        lines = storage.EVENTS_FILE.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])["id"], 2)
+        self.assertEqual(len(storage.get_events_for_entity("task", 1)), 2)
+
+    def test_add_event_converts_array_log(self):
+        storage.use_file_backend()
+        old = [models.EventLog(id=i, event_type="task_created", entity_type="task",
+                               entity_id=i, user_id=1).to_dict() for i in (1, 3, 2)]
+        storage.EVENTS_FILE.write_text(json.dumps(old, indent=2), encoding="utf-8")
+        e = storage.add_event("task_created", "task", 4, 1)
+        self.assertEqual(e.id, 4)
+        self.assertEqual([ev.id for ev in storage.load_events()], [1, 3, 2, 4])
+        self.assertFalse(storage.EVENTS_FILE.read_text(encoding="utf-8").startswith("["))
+
+    def test_add_event_reads_only_log_tail(self):
+        storage.use_file_backend()
+        storage.save_events([models.EventLog(id=i, event_type="task_created", entity_type="task",
+                                             entity_id=i, user_id=1) for i in range(1, 4)])
+        # A fresh process has no cached next id and must not parse the log
+        storage._derived_cache.clear()
+        orig_load_events = storage.load_events
+        storage.load_events = lambda: self.fail("add_event parsed the whole log")
+        try:
+            self.assertEqual(storage.add_event("task_created", "task", 4, 1).id, 4)
+        finally:
+            storage.load_events = orig_load_events
+
+    def test_next_event_id_follows_external_appends(self):
+        storage.use_file_backend()
+        storage.add_event("task_created", "task", 1, 1)
+        # Another process appends to the log; the cached next id goes stale
+        with open(storage.EVENTS_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(models.EventLog(id=10, event_type="task_created", entity_type="task",
+                                               entity_id=2, user_id=1).to_dict()) + "\n")
+        self.assertEqual(storage.add_event("task_created", "task", 3, 1).id, 11)
+
     def test_comments_round_trip(self):
         comments = [models.Comment(id=1, task_id=1, user_id=1, text="Hello")]
         storage.save_comments(comments)
@@ -484,32 +594,27 @@ class TestFormatters(BaseTestCase):
 class TestRecurringTasks(BaseTestCase):
 
     def test_recurring_rule_should_run_active(self):
-        from datetime import datetime, timedelta
         yesterday = (datetime.now() - timedelta(days=1)).isoformat()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=yesterday)
         self.assertTrue(rule.should_run())
 
     def test_recurring_rule_should_run_inactive(self):
-        from datetime import datetime, timedelta
         yesterday = (datetime.now() - timedelta(days=1)).isoformat()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=yesterday, active=False)
         self.assertFalse(rule.should_run())
 
     def test_recurring_rule_should_run_future(self):
-        from datetime import datetime, timedelta
         tomorrow = (datetime.now() + timedelta(days=1)).isoformat()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=tomorrow)
         self.assertFalse(rule.should_run())
 
     def test_recurring_rule_should_run_past_end_date(self):
-        from datetime import datetime, timedelta
         yesterday = (datetime.now() - timedelta(days=1)).isoformat()
         last_week = (datetime.now() - timedelta(days=7)).isoformat()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=yesterday, end_date=last_week)
         self.assertFalse(rule.should_run())
 
     def test_recurring_rule_advance_daily(self):
-        from datetime import datetime
         now = datetime.now()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=now.isoformat())
         rule.advance()
@@ -518,28 +623,24 @@ class TestRecurringTasks(BaseTestCase):
         self.assertGreater(next_run_dt, now)
 
     def test_recurring_rule_advance_weekly(self):
-        from datetime import datetime
         now = datetime.now()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="weekly", next_run=now.isoformat())
         rule.advance()
         self.assertEqual(rule.created_count, 1)
 
     def test_recurring_rule_advance_biweekly(self):
-        from datetime import datetime
         now = datetime.now()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="biweekly", next_run=now.isoformat())
         rule.advance()
         self.assertEqual(rule.created_count, 1)
 
     def test_recurring_rule_advance_monthly(self):
-        from datetime import datetime
         now = datetime.now()
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="monthly", next_run=now.isoformat())
         rule.advance()
         self.assertEqual(rule.created_count, 1)
 
     def test_recurring_storage_round_trip(self):
-        from datetime import datetime
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=datetime.now().isoformat())
         storage.save_recurring_rules([rule])
         loaded = storage.load_recurring_rules()
@@ -547,7 +648,6 @@ class TestRecurringTasks(BaseTestCase):
         self.assertEqual(loaded[0].frequency, "daily")
 
     def test_cmd_run_recurring_creates_tasks(self):
-        from datetime import datetime, timedelta
         # Create a template task
         task = models.Task(id=1, title="Template", project_id=1)
         storage.save_tasks([task])
@@ -564,8 +664,23 @@ class TestRecurringTasks(BaseTestCase):
         tasks = storage.load_tasks()
         self.assertEqual(len(tasks), 2)
 
+    def test_cmd_run_recurring_assigns_distinct_ids(self):
+        # Two rules firing in one run must not reuse the same new task id
+        storage.save_tasks([models.Task(id=1, title="Standup", project_id=1),
+                            models.Task(id=5, title="Review", project_id=1)])
+        yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+        storage.save_recurring_rules([
+            models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=yesterday),
+            models.RecurringRule(id=2, task_template_id=5, frequency="weekly", next_run=yesterday),
+        ])
+
+        commands.cmd_run_recurring(user_id=1)
+
+        tasks = storage.load_tasks()
+        self.assertEqual([(t.id, t.title) for t in tasks],
+                         [(1, "Standup"), (5, "Review"), (6, "Standup"), (7, "Review")])
+
     def test_recurring_with_past_end_date_no_create(self):
-        from datetime import datetime, timedelta
         # Create a template task
         task = models.Task(id=1, title="Template", project_id=1)
         storage.save_tasks([task])
@@ -584,7 +699,6 @@ class TestRecurringTasks(BaseTestCase):
         self.assertEqual(len(tasks), 1)
 
     def test_cmd_cancel_recurring(self):
-        from datetime import datetime
         rule = models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=datetime.now().isoformat())
         storage.save_recurring_rules([rule])
 
@@ -665,14 +779,9 @@ class TestTaskDependencies(BaseTestCase):
         commands.cmd_add_dependency(task_id=2, depends_on_id=1)
 
         # Capture stderr to check for warning
-        import io
-        old_stderr = sys.stderr
-        sys.stderr = io.StringIO()
-
-        commands.cmd_update_task(task_id=2, status="done")
-
-        output = sys.stderr.getvalue()
-        sys.stderr = old_stderr
+        with self.capture("stderr") as err:
+            commands.cmd_update_task(task_id=2, status="done")
+        output = err.getvalue()
 
         self.assertIn("WARNING", output)
         self.assertIn("incomplete", output.lower())
@@ -689,7 +798,6 @@ class TestActivityDashboard(BaseTestCase):
         self.assertTrue(result)
 
     def test_dashboard_counts_created_in_range(self):
-        from datetime import datetime, timedelta
         now = datetime.now()
         yesterday = now - timedelta(days=1)
         last_week = now - timedelta(days=8)
@@ -699,19 +807,13 @@ class TestActivityDashboard(BaseTestCase):
         storage.save_tasks([task1, task2])
 
         # Capture output
-        import io
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-
-        commands.cmd_dashboard(days=7)
-
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        with self.capture() as out:
+            commands.cmd_dashboard(days=7)
+        output = out.getvalue()
 
         self.assertIn("Tasks Created:", output)
 
     def test_dashboard_completion_rate(self):
-        from datetime import datetime, timedelta
         now = datetime.now()
         yesterday = now - timedelta(days=1)
 
@@ -720,19 +822,13 @@ class TestActivityDashboard(BaseTestCase):
         task2 = models.Task(id=2, title="Todo", project_id=1, created_at=yesterday.isoformat())
         storage.save_tasks([task1, task2])
 
-        import io
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-
-        commands.cmd_dashboard(days=7)
-
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        with self.capture() as out:
+            commands.cmd_dashboard(days=7)
+        output = out.getvalue()
 
         self.assertIn("Completion Rate:", output)
 
     def test_dashboard_avg_completion_time(self):
-        from datetime import datetime, timedelta
         now = datetime.now()
         yesterday = now - timedelta(days=1)
 
@@ -740,14 +836,9 @@ class TestActivityDashboard(BaseTestCase):
                           status="done", completed_at=now.isoformat())
         storage.save_tasks([task])
 
-        import io
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-
-        commands.cmd_dashboard(days=7)
-
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        with self.capture() as out:
+            commands.cmd_dashboard(days=7)
+        output = out.getvalue()
 
         self.assertIn("Avg Completion Time:", output)
 
@@ -769,5 +860,91 @@ class TestActivityDashboard(BaseTestCase):
         self.assertIn("60.0%", output)
 
 
+# ====================================================================
+# Batch Tests
+# ====================================================================
+
+class TestBatch(BaseTestCase):
+
+    def test_cmd_batch_runs_in_order(self):
+        with self.capture():
+            results = commands.cmd_batch([
+                {"command": "add_user", "username": "alice", "email": "a@t.com"},
+                {"command": "add_project", "name": "Proj", "owner_id": 1},
+                {"command": "add_task", "title": "First", "project_id": 1},
+                {"command": "update_task", "task_id": 1, "status": "done"},
+            ])
+        self.assertEqual(results, [True, True, True, True])
+        self.assertEqual(storage.get_task_by_id(1).status, "done")
+
+    def test_cmd_batch_rejects_unknown_commands_and_arguments(self):
+        with self.capture("stderr") as err, self.capture():
+            results = commands.cmd_batch([
+                {"command": "batch", "commands": []},
+                {"command": "get_task_by_id", "task_id": 1},
+                {"command": "add_task", "title": "No project"},
+                {"command": "list_users"},
+            ])
+        self.assertEqual(results, [False, False, False, None])
+        self.assertIn("Unknown command 'get_task_by_id'", err.getvalue())
+        self.assertIn("Bad arguments for 'add_task'", err.getvalue())
+
+    def test_cmd_batch_rejects_misspelt_keyword(self):
+        with self.capture("stderr") as err, self.capture():
+            results = commands.cmd_batch([
+                {"command": "add_task", "title": "X", "project_id": 1, "priorty": "high"},
+                {"command": "update_task", "task_id": 1, "stauts": "done"},
+            ])
+        self.assertEqual(results, [False, False])
+        self.assertIn("unexpected priorty", err.getvalue())
+        self.assertEqual(storage.load_tasks(), [])
+
+    def test_cmd_batch_continues_after_failing_command(self):
+        def explode(**kwargs):
+            raise RuntimeError("boom")
+        old = commands.BATCH_COMMANDS["summary"]
+        commands.BATCH_COMMANDS["summary"] = explode
+        try:
+            with self.capture("stderr") as err, self.capture():
+                results = commands.cmd_batch([
+                    {"command": "summary"},
+                    {"command": "add_user", "username": "alice", "email": "a@t.com"},
+                ])
+        finally:
+            commands.BATCH_COMMANDS["summary"] = old
+        self.assertEqual(results, [False, True])
+        self.assertIn("'summary' failed: boom", err.getvalue())
+
+    def test_cli_batch_reads_file(self):
+        import cli
+        batch_file = Path(self.test_dir) / "batch.json"
+        batch_file.write_text(json.dumps([
+            {"command": "add_user", "username": "alice", "email": "a@t.com"},
+            {"command": "list_users"},
+        ]))
+        old_argv = sys.argv
+        sys.argv = ["cli.py", "batch", str(batch_file)]
+        try:
+            with self.capture() as out:
+                cli.main()
+        finally:
+            sys.argv = old_argv
+        self.assertIn("alice", out.getvalue())
+        self.assertEqual(storage.get_user_by_id(1).username, "alice")
+
+    def test_cli_batch_rejects_non_list(self):
+        import cli
+        batch_file = Path(self.test_dir) / "batch.json"
+        batch_file.write_text('{"command": "list_users"}')
+        old_argv = sys.argv
+        sys.argv = ["cli.py", "batch", str(batch_file)]
+        try:
+            with self.capture("stderr") as err, self.assertRaises(SystemExit):
+                cli.main()
+        finally:
+            sys.argv = old_argv
+        self.assertIn("JSON list of objects", err.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,7 @@ Input validation for all entities.
 
 import re
 from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 from models import TaskStatus, TaskPriority
 
 
@@ -132,32 +132,32 @@ def validate_task_create(title: str, project_id: int, status: str = "todo",
     return len(errors) == 0, errors
 
 
-def validate_no_circular_dependency(task_id: int, depends_on_id: int, existing_deps) -> Tuple[bool, str]:
-    """Check for circular dependencies transitively."""
-    # Build dependency graph
-    graph = {}
-    for d in existing_deps:
-        if d.task_id not in graph:
-            graph[d.task_id] = []
-        graph[d.task_id].append(d.depends_on_id)
-
-    # Add the new dependency
-    if task_id not in graph:
-        graph[task_id] = []
-    graph[task_id].append(depends_on_id)
-
-    # Check if depends_on_id can reach task_id (which would create a cycle)
-    visited = set()
+def validate_no_circular_dependency(task_id: int, depends_on_id: int, existing_deps,
+                                    graph: Optional[Dict[int, List[int]]] = None) -> Tuple[bool, str]:
+    """Check for circular dependencies transitively.
+
+    `graph` may supply a prebuilt {task_id: [depends_on_id, ...]} map of
+    existing_deps (see storage.get_dependency_adjacency) to skip rebuilding it.
+    """
+    if graph is None:
+        graph = {}
+        for d in existing_deps:
+            graph.setdefault(d.task_id, []).append(d.depends_on_id)
+
+    # The new edge task_id -> depends_on_id closes a cycle iff task_id is
+    # reachable from depends_on_id. Iterative DFS; nodes are marked when
+    # pushed so each is expanded at most once.
+    if depends_on_id == task_id:
+        return False, "Circular dependency detected"
+    visited = {depends_on_id}
     stack = [depends_on_id]
 
     while stack:
-        current = stack.pop()
-        if current == task_id:
-            return False, "Circular dependency detected"
-        if current in visited:
-            continue
-        visited.add(current)
-        if current in graph:
-            stack.extend(graph[current])
+        for nxt in graph.get(stack.pop(), ()):
+            if nxt == task_id:
+                return False, "Circular dependency detected"
+            if nxt not in visited:
+                visited.add(nxt)
+                stack.append(nxt)
 
     return True, ""
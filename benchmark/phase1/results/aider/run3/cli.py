@@ -6,16 +6,79 @@ Usage: python cli.py <command> [options]
 
 import sys
 import argparse
-from commands import (
-    cmd_init, cmd_add_user, cmd_list_users,
-    cmd_add_project, cmd_list_projects, cmd_show_project,
-    cmd_add_task, cmd_list_tasks, cmd_show_task,
-    cmd_update_task, cmd_delete_task,
-    cmd_add_comment, cmd_export, cmd_summary,
-    cmd_add_recurring, cmd_list_recurring, cmd_run_recurring, cmd_cancel_recurring,
-    cmd_add_dependency, cmd_list_dependencies, cmd_remove_dependency,
-    cmd_dashboard,
-)
+
+
+# Each subparser records, via set_defaults, the name of its handler in the
+# commands module (func), the attributes passed to it positionally (argmap)
+# and, for commands whose options become a dict, a builder for the keyword
+# arguments (build).
+
+def _task_list_kwargs(args) -> dict:
+    filters = {}
+    if args.status:
+        filters["status"] = args.status
+    if args.priority:
+        filters["priority"] = args.priority
+    if args.project:
+        filters["project_id"] = args.project
+    if args.assignee:
+        filters["assignee_id"] = args.assignee
+    if args.tag:
+        filters["tag"] = args.tag
+    if args.search:
+        filters["search"] = args.search
+    filters["sort_by"] = args.sort
+    filters["sort_reverse"] = args.reverse
+    return {"filters": filters, "format": args.format}
+
+
+def _task_update_kwargs(args) -> dict:
+    updates = {}
+    if args.title is not None:
+        updates["title"] = args.title
+    if args.status is not None:
+        updates["status"] = args.status
+    if args.priority is not None:
+        updates["priority"] = args.priority
+    if args.assignee is not None:
+        updates["assignee_id"] = args.assignee
+    if args.due is not None:
+        updates["due_date"] = args.due
+    if args.tags is not None:
+        updates["tags"] = args.tags
+    if args.description is not None:
+        updates["description"] = args.description
+    if not updates:
+        print("Error: No fields to update", file=sys.stderr)
+        sys.exit(1)
+    return updates
+
+
+def _export_kwargs(args) -> dict:
+    filters = {}
+    if args.status:
+        filters["status"] = args.status
+    if args.project:
+        filters["project_id"] = args.project
+    return {"format": args.format, "output": args.output, "filters": filters,
+            "stream": args.stream}
+
+
+def _dep_pairs_kwargs(args) -> dict:
+    """Read "<task_id> <depends_on_id>" pairs, one per line; blank lines and
+    #-comments are skipped, and a comma may stand in for the space."""
+    pairs = []
+    for lineno, line in enumerate(args.file, 1):
+        fields = line.split("#", 1)[0].replace(",", " ").split()
+        if not fields:
+            continue
+        try:
+            task_id, depends_on_id = (int(x) for x in fields)
+        except ValueError:
+            print(f"Error: line {lineno}: expected '<task_id> <depends_on_id>'", file=sys.stderr)
+            sys.exit(1)
+        pairs.append((task_id, depends_on_id))
+    return {"pairs": pairs}
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -26,29 +89,35 @@ def build_parser() -> argparse.ArgumentParser:
     sub = parser.add_subparsers(dest="command", help="Available commands")
 
     # init
-    sub.add_parser("init", help="Initialize data directory")
+    p = sub.add_parser("init", help="Initialize data directory")
+    p.set_defaults(func="cmd_init")
 
     # user add
     p = sub.add_parser("user-add", help="Add a user")
     p.add_argument("username")
     p.add_argument("email")
     p.add_argument("--role", default="member", choices=["admin", "member", "viewer"])
+    p.set_defaults(func="cmd_add_user", argmap=("username", "email", "role"))
 
     # user list
-    sub.add_parser("user-list", help="List users")
+    p = sub.add_parser("user-list", help="List users")
+    p.set_defaults(func="cmd_list_users")
 
     # project add
     p = sub.add_parser("project-add", help="Create a project")
     p.add_argument("name")
     p.add_argument("--owner", type=int, required=True)
     p.add_argument("--description", default="")
+    p.set_defaults(func="cmd_add_project", argmap=("name", "owner", "description"))
 
     # project list
-    sub.add_parser("project-list", help="List projects")
+    p = sub.add_parser("project-list", help="List projects")
+    p.set_defaults(func="cmd_list_projects")
 
     # project show
     p = sub.add_parser("project-show", help="Show project details")
     p.add_argument("project_id", type=int)
+    p.set_defaults(func="cmd_show_project", argmap=("project_id",))
 
     # task add
     p = sub.add_parser("task-add", help="Create a task")
@@ -60,6 +129,8 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--due", default="")
     p.add_argument("--tags", nargs="*", default=[])
     p.add_argument("--description", default="")
+    p.set_defaults(func="cmd_add_task", argmap=("title", "project", "assignee", "priority",
+                                                "due", "tags", "description"))
 
     # task list
     p = sub.add_parser("task-list", help="List tasks")
@@ -72,10 +143,12 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--sort", default="created_at")
     p.add_argument("--reverse", action="store_true")
     p.add_argument("--format", default="lines", choices=["lines", "table"])
+    p.set_defaults(func="cmd_list_tasks", build=_task_list_kwargs)
 
     # task show
     p = sub.add_parser("task-show", help="Show task details")
     p.add_argument("task_id", type=int)
+    p.set_defaults(func="cmd_show_task", argmap=("task_id",))
 
     # task update
     p = sub.add_parser("task-update", help="Update a task")
@@ -87,17 +160,20 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--due", default=None)
     p.add_argument("--tags", nargs="*", default=None)
     p.add_argument("--description", default=None)
+    p.set_defaults(func="cmd_update_task", argmap=("task_id",), build=_task_update_kwargs)
 
     # task delete
     p = sub.add_parser("task-delete", help="Delete a task")
     p.add_argument("task_id", type=int)
     p.add_argument("--user", type=int, default=0)
+    p.set_defaults(func="cmd_delete_task", argmap=("task_id", "user"))
 
     # comment add
     p = sub.add_parser("comment-add", help="Add a comment to a task")
     p.add_argument("task_id", type=int)
     p.add_argument("--user", type=int, required=True)
     p.add_argument("text")
+    p.set_defaults(func="cmd_add_comment", argmap=("task_id", "user", "text"))
 
     # export
     p = sub.add_parser("export", help="Export tasks")
@@ -105,46 +181,64 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--output", default="")
     p.add_argument("--status", default=None)
     p.add_argument("--project", type=int, default=None)
+    p.add_argument("--stream", action="store_true",
+                   help="Read and write tasks one at a time, in file order")
+    p.set_defaults(func="cmd_export", build=_export_kwargs)
 
     # summary
     p = sub.add_parser("summary", help="Show task summary")
     p.add_argument("--project", type=int, default=None)
+    p.set_defaults(func="cmd_summary", argmap=("project",))
 
     # recurring-add
     p = sub.add_parser("recurring-add", help="Create a recurring rule from a task")
     p.add_argument("task_id", type=int)
     p.add_argument("--frequency", required=True, choices=["daily", "weekly", "biweekly", "monthly"])
     p.add_argument("--end", default=None)
+    p.set_defaults(func="cmd_add_recurring", argmap=("task_id", "frequency", "end"))
 
     # recurring-list
-    sub.add_parser("recurring-list", help="List recurring rules")
+    p = sub.add_parser("recurring-list", help="List recurring rules")
+    p.set_defaults(func="cmd_list_recurring")
 
     # recurring-run
     p = sub.add_parser("recurring-run", help="Run recurring rules and create tasks")
     p.add_argument("--user", type=int, default=0)
+    p.set_defaults(func="cmd_run_recurring", argmap=("user",))
 
     # recurring-cancel
     p = sub.add_parser("recurring-cancel", help="Cancel a recurring rule")
     p.add_argument("rule_id", type=int)
+    p.set_defaults(func="cmd_cancel_recurring", argmap=("rule_id",))
 
     # dep-add
     p = sub.add_parser("dep-add", help="Add a task dependency")
     p.add_argument("task_id", type=int)
     p.add_argument("depends_on", type=int)
+    p.set_defaults(func="cmd_add_dependency", argmap=("task_id", "depends_on"))
+
+    # dep-add-bulk
+    p = sub.add_parser("dep-add-bulk", help="Add task dependencies read from a file or stdin")
+    p.add_argument("file", nargs="?", type=argparse.FileType("r"), default=sys.stdin,
+                   help="Lines of '<task_id> <depends_on_id>' (default: stdin)")
+    p.set_defaults(func="cmd_add_dependencies_bulk", build=_dep_pairs_kwargs)
 
     # dep-list
     p = sub.add_parser("dep-list", help="List task dependencies")
     p.add_argument("task_id", type=int)
+    p.set_defaults(func="cmd_list_dependencies", argmap=("task_id",))
 
     # dep-remove
     p = sub.add_parser("dep-remove", help="Remove a task dependency")
     p.add_argument("task_id", type=int)
     p.add_argument("depends_on", type=int)
+    p.set_defaults(func="cmd_remove_dependency", argmap=("task_id", "depends_on"))
 
     # dashboard
     p = sub.add_parser("dashboard", help="Show activity dashboard")
     p.add_argument("--days", type=int, default=7)
     p.add_argument("--user", type=int, default=None)
+    p.set_defaults(func="cmd_dashboard", argmap=("days", "user"))
 
     return parser
 
@@ -157,92 +251,14 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    if args.command == "init":
-        cmd_init()
-    elif args.command == "user-add":
-        cmd_add_user(args.username, args.email, args.role)
-    elif args.command == "user-list":
-        cmd_list_users()
-    elif args.command == "project-add":
-        cmd_add_project(args.name, args.owner, args.description)
-    elif args.command == "project-list":
-        cmd_list_projects()
-    elif args.command == "project-show":
-        cmd_show_project(args.project_id)
-    elif args.command == "task-add":
-        cmd_add_task(args.title, args.project, args.assignee,
-                     args.priority, args.due, args.tags, args.description)
-    elif args.command == "task-list":
-        filters = {}
-        if args.status:
-            filters["status"] = args.status
-        if args.priority:
-            filters["priority"] = args.priority
-        if args.project:
-            filters["project_id"] = args.project
-        if args.assignee:
-            filters["assignee_id"] = args.assignee
-        if args.tag:
-            filters["tag"] = args.tag
-        if args.search:
-            filters["search"] = args.search
-        filters["sort_by"] = args.sort
-        filters["sort_reverse"] = args.reverse
-        cmd_list_tasks(filters=filters, format=args.format)
-    elif args.command == "task-show":
-        cmd_show_task(args.task_id)
-    elif args.command == "task-update":
-        updates = {}
-        if args.title is not None:
-            updates["title"] = args.title
-        if args.status is not None:
-            updates["status"] = args.status
-        if args.priority is not None:
-            updates["priority"] = args.priority
-        if args.assignee is not None:
-            updates["assignee_id"] = args.assignee
-        if args.due is not None:
-            updates["due_date"] = args.due
-        if args.tags is not None:
-            updates["tags"] = args.tags
-        if args.description is not None:
-            updates["description"] = args.description
-        if not updates:
-            print("Error: No fields to update", file=sys.stderr)
-            sys.exit(1)
-        cmd_update_task(args.task_id, **updates)
-    elif args.command == "task-delete":
-        cmd_delete_task(args.task_id, args.user)
-    elif args.command == "comment-add":
-        cmd_add_comment(args.task_id, args.user, args.text)
-    elif args.command == "export":
-        filters = {}
-        if args.status:
-            filters["status"] = args.status
-        if args.project:
-            filters["project_id"] = args.project
-        cmd_export(format=args.format, output=args.output, filters=filters)
-    elif args.command == "summary":
-        cmd_summary(project_id=args.project)
-    elif args.command == "recurring-add":
-        cmd_add_recurring(args.task_id, args.frequency, args.end)
-    elif args.command == "recurring-list":
-        cmd_list_recurring()
-    elif args.command == "recurring-run":
-        cmd_run_recurring(args.user)
-    elif args.command == "recurring-cancel":
-        cmd_cancel_recurring(args.rule_id)
-    elif args.command == "dep-add":
-        cmd_add_dependency(args.task_id, args.depends_on)
-    elif args.command == "dep-list":
-        cmd_list_dependencies(args.task_id)
-    elif args.command == "dep-remove":
-        cmd_remove_dependency(args.task_id, args.depends_on)
-    elif args.command == "dashboard":
-        cmd_dashboard(days=args.days, user_id=args.user)
-    else:
-        parser.print_help()
-        sys.exit(1)
+    positional = [getattr(args, name) for name in getattr(args, "argmap", ())]
+    build = getattr(args, "build", None)
+    kwargs = build(args) if build else {}
+
+    # Imported only once a subcommand has been chosen, so --help and usage
+    # errors don't pay for loading storage, models and the formatters
+    import commands
+    getattr(commands, args.func)(*positional, **kwargs)
 
 
 if __name__ == "__main__":
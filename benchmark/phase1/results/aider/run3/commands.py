@@ -6,10 +6,12 @@ All CLI command handlers.
 
 import sys
 import json
-from typing import List, Optional
+from collections import Counter
+from itertools import chain
+from typing import List, Optional, Tuple
 from models import Task, Project, User, Comment, RecurringRule, TaskDependency
 from storage import (
-    load_tasks, save_tasks, get_task_by_id, get_next_task_id,
+    load_tasks, iter_tasks, save_tasks, get_task_by_id, get_next_task_id,
     load_projects, save_projects, get_project_by_id, get_next_project_id,
     load_users, save_users, get_user_by_id, get_next_user_id,
     load_comments, save_comments, get_next_comment_id,
@@ -17,16 +19,14 @@ from storage import (
     get_events_for_entity, add_event, ensure_data_dir,
     load_recurring_rules, save_recurring_rules, get_recurring_rule_by_id, get_next_recurring_id,
     load_dependencies, save_dependencies, get_dependencies_for_task, 
-    get_dependents_of_task, get_next_dependency_id,
-    load_events,
+    get_next_dependency_id, dependency_batch,
 )
-from filters import apply_filters
+from filters import apply_filters, iter_filters
 from formatters import (
     format_task_line, format_task_detail, format_task_table,
     format_project_line, format_project_detail,
     format_summary, format_user_line,
 )
-from exporters import export_to_csv, export_to_json, export_to_markdown, generate_summary
 from validators import validate_task_create, validate_title, validate_email, validate_username, validate_no_circular_dependency
 from plugins import plugin_manager
 
@@ -330,14 +330,26 @@ def cmd_add_comment(task_id: int, user_id: int, text: str, **kwargs):
     return True
 
 
-def cmd_export(format: str = "csv", output: str = "", filters: Optional[dict] = None, **kwargs):
-    """Export tasks to file."""
-    tasks = load_tasks()
-    if filters:
-        tasks = apply_filters(tasks, filters)
+def cmd_export(format: str = "csv", output: str = "", filters: Optional[dict] = None,
+               stream: bool = False, **kwargs):
+    """Export tasks to file.
+
+    With `stream`, tasks are read and written one at a time in file order
+    (unsorted), and export_pre gets count=None since it isn't known yet.
+    """
+    if stream:
+        tasks = iter_tasks()
+        if filters:
+            tasks = iter_filters(tasks, filters)
+    else:
+        tasks = load_tasks()
+        if filters:
+            tasks = apply_filters(tasks, filters)
 
     # Fire pre-export hook
-    plugin_manager.fire("export_pre", format=format, count=len(tasks))
+    plugin_manager.fire("export_pre", format=format, count=None if stream else len(tasks))
+
+    from exporters import export_to_csv, export_to_json, export_to_markdown
 
     if format == "csv":
         filepath = output or "tasks_export.csv"
@@ -364,6 +376,7 @@ def cmd_summary(project_id: Optional[int] = None, **kwargs):
     tasks = load_tasks()
     if project_id:
         tasks = [t for t in tasks if t.project_id == project_id]
+    from exporters import generate_summary
     summary = generate_summary(tasks)
     print(format_summary(summary))
     return True
@@ -495,12 +508,13 @@ def cmd_cancel_recurring(rule_id: int, **kwargs):
 
 def cmd_add_dependency(task_id: int, depends_on_id: int, **kwargs):
     """Create a task dependency."""
-    task = get_task_by_id(task_id)
+    by_id = {t.id: t for t in load_tasks()}
+    task = by_id.get(task_id)
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
         return False
 
-    depends_on = get_task_by_id(depends_on_id)
+    depends_on = by_id.get(depends_on_id)
     if not depends_on:
         print(f"Error: Task #{depends_on_id} not found", file=sys.stderr)
         return False
@@ -510,15 +524,17 @@ def cmd_add_dependency(task_id: int, depends_on_id: int, **kwargs):
         return False
 
     deps = load_dependencies()
+    graph = {}
+    for d in deps:
+        graph.setdefault(d.task_id, []).append(d.depends_on_id)
 
     # Check for duplicate
-    for d in deps:
-        if d.task_id == task_id and d.depends_on_id == depends_on_id:
-            print(f"Error: Dependency already exists", file=sys.stderr)
-            return False
+    if depends_on_id in graph.get(task_id, ()):
+        print(f"Error: Dependency already exists", file=sys.stderr)
+        return False
 
     # Check for circular dependency
-    ok, msg = validate_no_circular_dependency(task_id, depends_on_id, deps)
+    ok, msg = validate_no_circular_dependency(task_id, depends_on_id, deps, graph=graph)
     if not ok:
         print(f"Error: {msg}", file=sys.stderr)
         return False
@@ -535,15 +551,28 @@ def cmd_add_dependency(task_id: int, depends_on_id: int, **kwargs):
     return True
 
 
+def cmd_add_dependencies_bulk(pairs: List[Tuple[int, int]], **kwargs):
+    """Create many dependencies, writing the dependency file once."""
+    added = 0
+    with dependency_batch():
+        for task_id, depends_on_id in pairs:
+            if cmd_add_dependency(task_id, depends_on_id):
+                added += 1
+    print(f"Added {added} of {len(pairs)} dependencies")
+    return added == len(pairs)
+
+
 def cmd_list_dependencies(task_id: int, **kwargs):
     """Show what a task depends on and what depends on it."""
-    task = get_task_by_id(task_id)
+    by_id = {t.id: t for t in load_tasks()}
+    task = by_id.get(task_id)
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
         return False
 
-    depends_on = get_dependencies_for_task(task_id)
-    dependents = get_dependents_of_task(task_id)
+    deps = load_dependencies()
+    depends_on = [d for d in deps if d.task_id == task_id]
+    dependents = [d for d in deps if d.depends_on_id == task_id]
 
     print(f"Dependencies for task #{task_id}: {task.title}")
     print()
@@ -551,7 +580,7 @@ def cmd_list_dependencies(task_id: int, **kwargs):
     if depends_on:
         print(f"This task depends on ({len(depends_on)}):")
         for d in depends_on:
-            dep_task = get_task_by_id(d.depends_on_id)
+            dep_task = by_id.get(d.depends_on_id)
             if dep_task:
                 status_icon = "✓" if dep_task.status == "done" else "○"
                 print(f"  {status_icon} #{dep_task.id}: {dep_task.title} ({dep_task.status})")
@@ -563,7 +592,7 @@ def cmd_list_dependencies(task_id: int, **kwargs):
     if dependents:
         print(f"Tasks that depend on this ({len(dependents)}):")
         for d in dependents:
-            dep_task = get_task_by_id(d.task_id)
+            dep_task = by_id.get(d.task_id)
             if dep_task:
                 print(f"  #{dep_task.id}: {dep_task.title} ({dep_task.status})")
     else:
@@ -576,18 +605,19 @@ def cmd_remove_dependency(task_id: int, depends_on_id: int, **kwargs):
     """Remove a task dependency."""
     deps = load_dependencies()
     found = False
-    new_deps = []
-    for d in deps:
+    # Delete in place, walking backwards so indices stay valid; normally
+    # there is exactly one match, but hand-edited files may hold repeats
+    for i in range(len(deps) - 1, -1, -1):
+        d = deps[i]
         if d.task_id == task_id and d.depends_on_id == depends_on_id:
+            del deps[i]
             found = True
-        else:
-            new_deps.append(d)
 
     if not found:
         print(f"Error: Dependency not found", file=sys.stderr)
         return False
 
-    save_dependencies(new_deps)
+    save_dependencies(deps)
     print(f"Removed dependency: task #{task_id} no longer depends on task #{depends_on_id}")
     return True
 
@@ -601,73 +631,70 @@ def cmd_dashboard(days: int = 7, user_id: Optional[int] = None, **kwargs):
     from datetime import datetime, timedelta
     
     tasks = load_tasks()
-    events = load_events()
     
     # Calculate date range
     now = datetime.now()
     start_date = now - timedelta(days=days)
     
-    # Filter tasks and events by date range
-    tasks_created = []
-    tasks_completed = []
+    # One pass over the tasks; each timestamp is parsed once
+    created_count = 0
+    completed_count = 0
+    completion_hours = 0.0
+    completion_n = 0
+    # Keys are collected and counted in bulk afterwards; created tasks are
+    # counted before completed ones, matching the original tally order
+    statuses = []
+    created_users = []
+    completed_users = []
+    created_projects = []
+    completed_projects = []
+    overdue_count = 0
     
     for t in tasks:
+        # Overdue is counted across all users
+        if t.is_overdue(now):
+            overdue_count += 1
+        if user_id is not None and t.assignee_id != user_id:
+            continue
+        
+        statuses.append(t.status)
+        
         try:
             created_dt = datetime.fromisoformat(t.created_at)
-            if created_dt >= start_date:
-                if user_id is None or t.assignee_id == user_id:
-                    tasks_created.append(t)
         except ValueError:
-            pass
+            created_dt = None
+        if created_dt is not None and created_dt >= start_date:
+            created_count += 1
+            if t.assignee_id:
+                created_users.append(t.assignee_id)
+            created_projects.append(t.project_id)
         
         if t.status == "done" and t.completed_at:
             try:
                 completed_dt = datetime.fromisoformat(t.completed_at)
-                if completed_dt >= start_date:
-                    if user_id is None or t.assignee_id == user_id:
-                        tasks_completed.append(t)
             except ValueError:
-                pass
+                continue
+            if completed_dt >= start_date:
+                completed_count += 1
+                if t.assignee_id:
+                    completed_users.append(t.assignee_id)
+                completed_projects.append(t.project_id)
+                if created_dt is not None:
+                    completion_hours += (completed_dt - created_dt).total_seconds() / 3600
+                    completion_n += 1
     
-    # Calculate metrics
-    created_count = len(tasks_created)
-    completed_count = len(tasks_completed)
     completion_rate = (completed_count / created_count * 100) if created_count > 0 else 0.0
+    avg_completion_time = completion_hours / completion_n if completion_n else 0.0
     
-    # Average completion time
-    completion_times = []
-    for t in tasks_completed:
-        try:
-            created_dt = datetime.fromisoformat(t.created_at)
-            completed_dt = datetime.fromisoformat(t.completed_at)
-            delta = completed_dt - created_dt
-            completion_times.append(delta.total_seconds() / 3600)  # hours
-        except ValueError:
-            pass
-    
-    avg_completion_time = sum(completion_times) / len(completion_times) if completion_times else 0.0
+    status_breakdown = dict(Counter(statuses))
     
     # Most active user
-    user_activity = {}
-    for t in tasks_created + tasks_completed:
-        if t.assignee_id:
-            user_activity[t.assignee_id] = user_activity.get(t.assignee_id, 0) + 1
-    most_active_user = max(user_activity.items(), key=lambda x: x[1])[0] if user_activity else None
+    user_activity = Counter(chain(created_users, completed_users))
+    most_active_user = user_activity.most_common(1)[0][0] if user_activity else None
     
     # Busiest project
-    project_activity = {}
-    for t in tasks_created + tasks_completed:
-        project_activity[t.project_id] = project_activity.get(t.project_id, 0) + 1
-    busiest_project = max(project_activity.items(), key=lambda x: x[1])[0] if project_activity else None
-    
-    # Overdue tasks
-    overdue_count = sum(1 for t in tasks if t.is_overdue())
-    
-    # Tasks by status
-    status_breakdown = {}
-    for t in tasks:
-        if user_id is None or t.assignee_id == user_id:
-            status_breakdown[t.status] = status_breakdown.get(t.status, 0) + 1
+    project_activity = Counter(chain(created_projects, completed_projects))
+    busiest_project = project_activity.most_common(1)[0][0] if project_activity else None
     
     # Build dashboard data
     dashboard_data = {
@@ -7,68 +7,132 @@ Export tasks to various formats.
 import csv
 import json
 import io
+from collections import Counter
 from datetime import datetime
-from typing import List
+from itertools import chain, count
+from typing import Iterable, Iterator, List, Optional, Tuple
 from models import Task
 
+try:
+    import orjson  # optional C-accelerated JSON encoder
+except ImportError:
+    orjson = None
 
-def export_to_csv(tasks: List[Task], filepath: str) -> int:
+
+def _peek(tasks: Iterable[Task]) -> Optional[Iterator[Task]]:
+    """Return an iterator over all of `tasks`, or None if there are none.
+
+    Lets the exporters take a lazy source such as storage.iter_tasks() and
+    still skip creating a file when there is nothing to write.
+    """
+    it = iter(tasks)
+    first = next(it, None)
+    if first is None:
+        return None
+    return chain((first,), it)
+
+
+def _counted(tasks: Iterator[Task]) -> Tuple[Iterator[Task], count]:
+    """Pair tasks with a counter whose next value is the number consumed."""
+    counter = count()
+    # zip stops as soon as tasks runs out, before drawing from the counter
+    return (t for t, _ in zip(tasks, counter)), counter
+
+
+_CSV_FIELDS = (
+    "id", "title", "project_id", "assignee_id", "status",
+    "priority", "description", "tags", "due_date",
+    "created_at", "updated_at", "completed_at",
+)
+
+
+def export_to_csv(tasks: Iterable[Task], filepath: str) -> int:
     """Export tasks to CSV file. Returns number of rows written."""
-    if not tasks:
+    it = _peek(tasks)
+    if it is None:
         return 0
-    fieldnames = [
-        "id", "title", "project_id", "assignee_id", "status",
-        "priority", "description", "tags", "due_date",
-        "created_at", "updated_at", "completed_at",
-    ]
+    it, written = _counted(it)
     with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for t in tasks:
-            row = t.to_dict()
-            row["tags"] = ";".join(row.get("tags", []))
-            writer.writerow(row)
-    return len(tasks)
+        writer = csv.writer(f)
+        writer.writerow(_CSV_FIELDS)
+        writer.writerows(_csv_row(t) for t in it)
+    return next(written)
 
 
-def export_to_json(tasks: List[Task], filepath: str) -> int:
-    """Export tasks to JSON file. Returns number of records written."""
-    if not tasks:
+def _csv_row(t: Task) -> tuple:
+    # Read straight off the task in _CSV_FIELDS order; no to_dict() copy
+    return (t.id, t.title, t.project_id, t.assignee_id, t.status,
+            t.priority, t.description, ";".join(t.tags), t.due_date,
+            t.created_at, t.updated_at, t.completed_at)
+
+
+def export_to_json(tasks: Iterable[Task], filepath: str) -> int:
+    """Export tasks to JSON file. Returns number of records written.
+
+    "count" precedes the task list when `tasks` has a length; for a lazy
+    source it is only known at the end, so it follows the list instead.
+    """
+    it = _peek(tasks)
+    if it is None:
         return 0
-    data = {
-        "exported_at": datetime.now().isoformat(),
-        "count": len(tasks),
-        "tasks": [t.to_dict() for t in tasks],
-    }
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    return len(tasks)
+    sized = hasattr(tasks, "__len__")
+    written = 0
+    # Written one task at a time rather than building the whole document;
+    # the output is the same as json.dump(..., indent=2) of the full dict.
+    with open(filepath, "wb") as f:
+        f.write(b'{\n  "exported_at": "%s",\n' % datetime.now().isoformat().encode())
+        if sized:
+            f.write(b'  "count": %d,\n' % len(tasks))
+        f.write(b'  "tasks": [\n')
+        for t in it:
+            if written:
+                f.write(b",\n")
+            f.write(b"    " + _encode_task(t).replace(b"\n", b"\n    "))
+            written += 1
+        f.write(b"\n  ]")
+        if not sized:
+            f.write(b',\n  "count": %d' % written)
+        f.write(b"\n}")
+    return written
+
+
+def _encode_task(t: Task) -> bytes:
+    """Encode one task as UTF-8 JSON with 2-space indentation."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively, in field order like
+        # to_dict(), with the same layout as json.dumps(indent=2, ensure_ascii=False)
+        return orjson.dumps(t, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(t.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+
 
+# One table row, including the newline that separates it from the line above
+_MD_ROW = "\n| {} | {} | {} | {} | {} | {} |".format
 
-def export_to_markdown(tasks: List[Task], filepath: str) -> int:
+
+def export_to_markdown(tasks: Iterable[Task], filepath: str) -> int:
     """Export tasks as a Markdown table. Returns number of rows written."""
-    if not tasks:
+    it = _peek(tasks)
+    if it is None:
         return 0
-    lines = [
+    it, written = _counted(it)
+    header = "\n".join([
         "# Task Export",
         "",
         f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
         "",
         "| ID | Title | Status | Priority | Assignee | Due Date |",
         "|-----|-------|--------|----------|----------|----------|",
-    ]
-    for t in tasks:
-        due = t.due_date or "-"
-        assignee = str(t.assignee_id) if t.assignee_id else "-"
-        lines.append(
-            f"| {t.id} | {t.title} | {t.status} | {t.priority} "
-            f"| {assignee} | {due} |"
-        )
-    lines.append("")
-    lines.append(f"**Total: {len(tasks)} tasks**")
+    ])
+    row = _MD_ROW
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    return len(tasks)
+        f.write(header)
+        f.writelines(
+            row(t.id, t.title, t.status, t.priority, t.assignee_id or "-", t.due_date or "-")
+            for t in it
+        )
+        n = next(written)
+        f.write(f"\n\n**Total: {n} tasks**")
+    return n
 
 
 def generate_summary(tasks: List[Task]) -> dict:
@@ -76,23 +140,11 @@ def generate_summary(tasks: List[Task]) -> dict:
     if not tasks:
         return {"total": 0}
 
-    by_status = {}
-    by_priority = {}
-    by_assignee = {}
-    overdue_count = 0
-
-    for t in tasks:
-        by_status[t.status] = by_status.get(t.status, 0) + 1
-        by_priority[t.priority] = by_priority.get(t.priority, 0) + 1
-        aid = t.assignee_id or "unassigned"
-        by_assignee[aid] = by_assignee.get(aid, 0) + 1
-        if t.is_overdue():
-            overdue_count += 1
-
+    now = datetime.now()
     return {
         "total": len(tasks),
-        "by_status": by_status,
-        "by_priority": by_priority,
-        "by_assignee": by_assignee,
-        "overdue": overdue_count,
+        "by_status": dict(Counter(t.status for t in tasks)),
+        "by_priority": dict(Counter(t.priority for t in tasks)),
+        "by_assignee": dict(Counter(t.assignee_id or "unassigned" for t in tasks)),
+        "overdue": sum(1 for t in tasks if t.is_overdue(now)),
     }
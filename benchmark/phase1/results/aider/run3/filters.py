@@ -5,7 +5,7 @@ Advanced filtering and search for tasks.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Callable
+from typing import Iterable, Iterator, List, Optional, Callable
 from models import Task, TaskStatus, TaskPriority
 
 
@@ -36,7 +36,8 @@ def filter_by_project(tasks: List[Task], project_id: int) -> List[Task]:
 
 def filter_overdue(tasks: List[Task]) -> List[Task]:
     """Return tasks that are past their due date and not done."""
-    return [t for t in tasks if t.is_overdue()]
+    now = datetime.now()
+    return [t for t in tasks if t.is_overdue(now)]
 
 
 def filter_due_within(tasks: List[Task], days: int) -> List[Task]:
@@ -105,6 +106,41 @@ def sort_tasks(tasks: List[Task], sort_by: str = "created_at",
     return sorted(tasks, key=key_fn, reverse=reverse)
 
 
+def iter_filters(tasks: Iterable[Task], filters: dict) -> Iterator[Task]:
+    """Lazily apply the per-task filters from apply_filters.
+
+    Supports status, priority, tag, assignee_id, project_id and search.
+    Tasks come out in input order: sort_by/sort_reverse are ignored, and the
+    date-based filters are rejected since they need apply_filters' list.
+    """
+    unsupported = {"overdue", "due_within_days"} & filters.keys()
+    if unsupported:
+        raise ValueError(f"Filters not supported when streaming: {', '.join(sorted(unsupported))}")
+
+    checks: List[Callable[[Task], bool]] = []
+    if "status" in filters:
+        status = filters["status"]
+        checks.append(lambda t: t.status == status)
+    if "priority" in filters:
+        priority = filters["priority"]
+        checks.append(lambda t: t.priority == priority)
+    if "tag" in filters:
+        tag = filters["tag"]
+        checks.append(lambda t: tag in t.tags)
+    if "assignee_id" in filters:
+        assignee_id = int(filters["assignee_id"])
+        checks.append(lambda t: t.assignee_id == assignee_id)
+    if "project_id" in filters:
+        project_id = int(filters["project_id"])
+        checks.append(lambda t: t.project_id == project_id)
+    if "search" in filters:
+        query_lower = filters["search"].lower()
+        checks.append(lambda t: query_lower in t.title.lower()
+                      or query_lower in t.description.lower())
+
+    return (t for t in tasks if all(check(t) for check in checks))
+
+
 def apply_filters(tasks: List[Task], filters: dict) -> List[Task]:
     """Apply multiple filters from a dict.
 
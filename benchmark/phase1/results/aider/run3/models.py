@@ -7,6 +7,7 @@ Core data classes for User, Project, Task, and EventLog.
 import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
@@ -37,6 +38,17 @@ class EventType(Enum):
     COMMENT_ADDED = "comment_added"
 
 
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    """datetime.fromisoformat, memoized.
+
+    Due dates repeat across tasks and the same task is checked by several
+    commands, so most lookups are hits. datetimes are immutable, so handing
+    out the cached object is safe.
+    """
+    return datetime.fromisoformat(value)
+
+
 @dataclass
 class User:
     id: int
@@ -81,12 +93,14 @@ class Task:
         if not self.updated_at:
             self.updated_at = now
 
-    def is_overdue(self) -> bool:
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """Past due and not done. Callers checking many tasks can pass `now`
+        once instead of reading the clock per task."""
         if not self.due_date or self.status == "done":
             return False
         try:
-            due = datetime.fromisoformat(self.due_date)
-            return datetime.now() > due
+            due = parse_timestamp(self.due_date)
+            return (now or datetime.now()) > due
         except ValueError:
             return False
 
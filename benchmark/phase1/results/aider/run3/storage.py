@@ -6,8 +6,9 @@ JSON file-based persistence for all entities.
 
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional
 from models import User, Task, Project, EventLog, Comment, RecurringRule, TaskDependency
 
 
@@ -94,6 +95,66 @@ def load_tasks() -> List[Task]:
     return [Task(**r) for r in raw]
 
 
+def iter_tasks(chunk_size: int = 1 << 16) -> Iterator[Task]:
+    """Yield tasks one at a time without loading the whole file.
+
+    Only one read chunk plus the task being decoded is held in memory, so
+    exports can handle task files larger than RAM.
+    """
+    for r in _iter_json_array(TASKS_FILE, chunk_size):
+        yield Task(**r)
+
+
+def _iter_json_array(filepath: Path, chunk_size: int) -> Iterator[Any]:
+    """Incrementally decode the elements of a file holding one JSON array."""
+    if not filepath.exists():
+        return
+    decoder = json.JSONDecoder()
+    with open(filepath, "r", encoding="utf-8") as f:
+        buf, pos, eof = "", 0, False
+        # "open" expects '[', "first" a value or ']', "value" a value and
+        # "next" a ',' or ']'
+        state = "open"
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos == len(buf):
+                if eof:
+                    raise json.JSONDecodeError("Unterminated array", buf, pos)
+                chunk = f.read(chunk_size)
+                buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+                continue
+            c = buf[pos]
+            if state == "open":
+                if c != "[":
+                    raise json.JSONDecodeError("Expecting '['", buf, pos)
+                pos += 1
+                state = "first"
+            elif c == "]" and state in ("first", "next"):
+                return
+            elif state == "next":
+                if c != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                pos += 1
+                state = "value"
+            else:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    end = len(buf)
+                # A value that runs to the end of the buffer may be cut short,
+                # and so may a number stopped at a '.', exponent or sign
+                if not eof and (end == len(buf) or buf[end] in ".eE+-"):
+                    chunk = f.read(chunk_size)
+                    buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+                    continue
+                yield value
+                pos = end
+                state = "next"
+
+
 def save_tasks(tasks: List[Task]):
     _save_json(TASKS_FILE, [t.to_dict() for t in tasks])
 
@@ -197,12 +258,41 @@ def get_next_recurring_id() -> int:
 
 # ---- Task Dependencies ----
 
+# Inside dependency_batch(), saves are held here instead of being written
+_dep_batch_depth = 0
+_dep_batch_pending: Optional[List[TaskDependency]] = None
+
+
+@contextmanager
+def dependency_batch():
+    """Defer dependency writes until the outermost batch exits.
+
+    Loads inside the batch see the pending list, so a loop of add/remove
+    commands behaves as usual but rewrites the file once instead of per call.
+    """
+    global _dep_batch_depth, _dep_batch_pending
+    _dep_batch_depth += 1
+    try:
+        yield
+    finally:
+        _dep_batch_depth -= 1
+        if _dep_batch_depth == 0 and _dep_batch_pending is not None:
+            pending, _dep_batch_pending = _dep_batch_pending, None
+            _save_json(DEPENDENCIES_FILE, [d.to_dict() for d in pending])
+
+
 def load_dependencies() -> List[TaskDependency]:
+    if _dep_batch_pending is not None:
+        return list(_dep_batch_pending)
     raw = _load_json(DEPENDENCIES_FILE)
     return [TaskDependency(**r) for r in raw]
 
 
 def save_dependencies(deps: List[TaskDependency]):
+    global _dep_batch_pending
+    if _dep_batch_depth:
+        _dep_batch_pending = list(deps)
+        return
     _save_json(DEPENDENCIES_FILE, [d.to_dict() for d in deps])
 
 
@@ -39,6 +39,8 @@ class BaseTestCase(unittest.TestCase):
         storage.TASKS_FILE = storage.DATA_DIR / "tasks.json"
         storage.EVENTS_FILE = storage.DATA_DIR / "events.json"
         storage.COMMENTS_FILE = storage.DATA_DIR / "comments.json"
+        storage.RECURRING_FILE = storage.DATA_DIR / "recurring.json"
+        storage.DEPENDENCIES_FILE = storage.DATA_DIR / "dependencies.json"
         storage.ensure_data_dir()
 
     def tearDown(self):
@@ -49,6 +51,8 @@ class BaseTestCase(unittest.TestCase):
         storage.TASKS_FILE = storage.DATA_DIR / "tasks.json"
         storage.EVENTS_FILE = storage.DATA_DIR / "events.json"
         storage.COMMENTS_FILE = storage.DATA_DIR / "comments.json"
+        storage.RECURRING_FILE = storage.DATA_DIR / "recurring.json"
+        storage.DEPENDENCIES_FILE = storage.DATA_DIR / "dependencies.json"
 
 
 # ====================================================================
@@ -156,6 +160,19 @@ class TestStorage(BaseTestCase):
         self.assertEqual(len(loaded), 2)
         self.assertIn("bug", loaded[1].tags)
 
+    def test_iter_tasks_matches_load(self):
+        tasks = [models.Task(id=i, title=f"Task {i}", project_id=1) for i in range(1, 6)]
+        storage.save_tasks(tasks)
+        streamed = list(storage.iter_tasks(chunk_size=16))
+        self.assertEqual(streamed, storage.load_tasks())
+
+    def test_iter_json_array_small_chunks(self):
+        path = storage.DATA_DIR / "numbers.json"
+        path.write_text('[-2500.0, 1, 1e5, -3.25E-2, 4E+1, "a-b", null]', encoding="utf-8")
+        expected = json.loads(path.read_text(encoding="utf-8"))
+        for chunk_size in (1, 2, 3, 5):
+            self.assertEqual(list(storage._iter_json_array(path, chunk_size)), expected)
+
     def test_get_tasks_by_project(self):
         tasks = [
             models.Task(id=1, title="A", project_id=1),
@@ -390,6 +407,15 @@ class TestExporters(BaseTestCase):
         self.assertEqual(exporters.export_to_csv([], "x.csv"), 0)
         self.assertEqual(exporters.export_to_json([], "x.json"), 0)
 
+    def test_export_json_from_iterator(self):
+        filepath = os.path.join(self.test_dir, "out.json")
+        count = exporters.export_to_json(iter(self._make_tasks()), filepath)
+        self.assertEqual(count, 2)
+        with open(filepath) as f:
+            data = json.load(f)
+        self.assertEqual(data["count"], 2)
+        self.assertEqual([t["title"] for t in data["tasks"]], ["A", "B"])
+
     def test_generate_summary(self):
         tasks = self._make_tasks()
         s = exporters.generate_summary(tasks)
@@ -629,6 +655,17 @@ class TestTaskDependencies(BaseTestCase):
         result = commands.cmd_add_dependency(3, 1)  # 3 depends on 1 (circular)
         self.assertFalse(result)
 
+    def test_dependency_batch_writes_once(self):
+        tasks = [models.Task(id=i, title=f"Task {i}", project_id=1) for i in range(1, 5)]
+        storage.save_tasks(tasks)
+
+        with storage.dependency_batch():
+            self.assertTrue(commands.cmd_add_dependencies_bulk([(2, 1), (3, 2)]))
+            self.assertFalse(commands.cmd_add_dependency(1, 3))  # cycle via pending deps
+            self.assertFalse(storage.DEPENDENCIES_FILE.exists())
+        deps = storage.load_dependencies()
+        self.assertEqual([(d.task_id, d.depends_on_id) for d in deps], [(2, 1), (3, 2)])
+
     def test_delete_task_removes_dependencies(self):
         task1 = models.Task(id=1, title="A", project_id=1)
         task2 = models.Task(id=2, title="B", project_id=1)
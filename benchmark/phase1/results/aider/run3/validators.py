@@ -6,7 +6,7 @@ Input validation for all entities.
 
 import re
 from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 from models import TaskStatus, TaskPriority
 
 
@@ -133,35 +133,34 @@ def validate_task_create(title: str, project_id: int, status: str = "todo",
 
 
 def validate_no_circular_dependency(task_id: int, depends_on_id: int, 
-                                   existing_deps: List) -> Tuple[bool, str]:
-    """Check for circular dependencies. Returns (valid, error_message)."""
-    # Build dependency graph
-    graph = {}
-    for dep in existing_deps:
-        if dep.task_id not in graph:
-            graph[dep.task_id] = []
-        graph[dep.task_id].append(dep.depends_on_id)
+                                   existing_deps: List,
+                                   graph: Optional[Dict[int, List[int]]] = None) -> Tuple[bool, str]:
+    """Check for circular dependencies. Returns (valid, error_message).
+
+    `graph` may supply a prebuilt {task_id: [depends_on_id, ...]} map of
+    existing_deps so callers that already have one skip rebuilding it.
+    """
+    if graph is None:
+        graph = {}
+        for dep in existing_deps:
+            graph.setdefault(dep.task_id, []).append(dep.depends_on_id)
     
-    # Add the new dependency
-    if task_id not in graph:
-        graph[task_id] = []
-    graph[task_id].append(depends_on_id)
+    # The new edge closes a cycle iff task_id is reachable from depends_on_id.
+    # Iterative DFS from that one node; nodes are marked when pushed so each
+    # is expanded at most once, and deep chains can't hit the recursion limit.
+    found = depends_on_id == task_id
+    visited = {depends_on_id}
+    stack = [depends_on_id]
+    while stack and not found:
+        for next_node in graph.get(stack.pop(), ()):
+            if next_node == task_id:
+                found = True
+                break
+            if next_node not in visited:
+                visited.add(next_node)
+                stack.append(next_node)
     
-    # Check if depends_on_id can reach task_id (which would create a cycle)
-    visited = set()
-    
-    def has_path(start: int, target: int) -> bool:
-        if start == target:
-            return True
-        if start in visited:
-            return False
-        visited.add(start)
-        for next_node in graph.get(start, []):
-            if has_path(next_node, target):
-                return True
-        return False
-    
-    if has_path(depends_on_id, task_id):
+    if found:
         return False, f"Circular dependency detected: task #{depends_on_id} already depends on #{task_id}"
     
     return True, ""
@@ -6,15 +6,18 @@ All CLI command handlers.
 
 import sys
 import json
+from collections import Counter
+from itertools import chain
+from operator import attrgetter, itemgetter
 from typing import List, Optional
 from models import Task, Project, User, Comment, RecurringRule, TaskDependency
 from storage import (
     load_tasks, save_tasks, get_task_by_id, get_next_task_id,
     load_projects, save_projects, get_project_by_id, get_next_project_id,
-    load_users, save_users, get_user_by_id, get_next_user_id,
+    load_users, save_users, get_user_by_id,
     load_comments, save_comments, get_next_comment_id,
     get_tasks_by_project, get_comments_for_task,
-    get_events_for_entity, add_event, ensure_data_dir,
+    get_events_for_entity, add_event, ensure_data_dir, index_by_id,
     load_recurring_rules, save_recurring_rules, get_recurring_rule_by_id, get_next_recurring_id,
     load_dependencies, save_dependencies, get_dependencies_for_task, get_dependents_of_task, get_next_dependency_id,
 )
@@ -48,11 +51,14 @@ def cmd_add_user(username: str, email: str, role: str = "member", **kwargs):
         return False
 
     users = load_users()
-    if any(u.username == username for u in users):
+    # A list comprehension plus `in` beats any() over a generator here, and
+    # a set would cost more to build than the single lookup saves
+    if username in [u.username for u in users]:
         print(f"Error: Username '{username}' already exists", file=sys.stderr)
         return False
 
-    user = User(id=get_next_user_id(), username=username, email=email, role=role)
+    next_id = max((u.id for u in users), default=0) + 1
+    user = User(id=next_id, username=username, email=email, role=role)
     users.append(user)
     save_users(users)
 
@@ -140,7 +146,8 @@ def cmd_add_task(title: str, project_id: int, assignee_id: Optional[int] = None,
         return False
 
     # Fire pre-create hook
-    plugin_manager.fire("task_pre_create", title=title, project_id=project_id)
+    if plugin_manager.has("task_pre_create"):
+        plugin_manager.fire("task_pre_create", title=title, project_id=project_id)
 
     tasks = load_tasks()
     task = Task(
@@ -156,7 +163,8 @@ def cmd_add_task(title: str, project_id: int, assignee_id: Optional[int] = None,
               {"title": title, "project_id": project_id})
 
     # Fire post-create hook
-    plugin_manager.fire("task_post_create", task=task)
+    if plugin_manager.has("task_post_create"):
+        plugin_manager.fire("task_post_create", task=task)
 
     print(f"Created task #{task.id}: {title}")
     return True
@@ -191,21 +199,34 @@ def cmd_show_task(task_id: int, **kwargs):
     return True
 
 
+# Task fields cmd_update_task knows how to update
+_UPDATABLE_FIELDS = ("title", "status", "priority", "assignee_id",
+                     "due_date", "tags", "description")
+
+
 def cmd_update_task(task_id: int, **updates):
     """Update task fields."""
+    from datetime import datetime
+    now_iso = datetime.now().isoformat()
+
     tasks = load_tasks()
-    task = None
-    for t in tasks:
-        if t.id == task_id:
-            task = t
-            break
+    tasks_by_id = index_by_id(tasks)
+    task = tasks_by_id.get(task_id)
 
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
         return False
 
+    # Setting every field to the value it already has changes nothing, so
+    # skip the hooks, the rewrite of the task file and the event
+    if all(getattr(task, field) == updates[field]
+           for field in _UPDATABLE_FIELDS if field in updates):
+        print(f"No changes to task #{task_id}")
+        return True
+
     # Fire pre-update hook
-    plugin_manager.fire("task_pre_update", task=task, updates=updates)
+    if plugin_manager.has("task_pre_update"):
+        plugin_manager.fire("task_pre_update", task=task, updates=updates)
 
     changed = {}
     if "title" in updates:
@@ -217,7 +238,7 @@ def cmd_update_task(task_id: int, **updates):
         task.title = updates["title"]
 
     if "status" in updates:
-        old_status = task.update_status(updates["status"])
+        old_status = task.update_status(updates["status"], now_iso=now_iso)
         changed["status"] = (old_status, updates["status"])
 
         # Check for incomplete dependencies when marking as done
@@ -225,7 +246,7 @@ def cmd_update_task(task_id: int, **updates):
             dependencies = get_dependencies_for_task(task_id)
             incomplete_deps = []
             for dep in dependencies:
-                dep_task = get_task_by_id(dep.depends_on_id)
+                dep_task = tasks_by_id.get(dep.depends_on_id)
                 if dep_task and dep_task.status != "done":
                     incomplete_deps.append(dep_task)
 
@@ -235,8 +256,9 @@ def cmd_update_task(task_id: int, **updates):
                     print(f"  - Task #{dep_task.id}: {dep_task.title} (status: {dep_task.status})", file=sys.stderr)
 
         # Fire status change hook
-        plugin_manager.fire("task_status_change", task=task,
-                            old_status=old_status, new_status=updates["status"])
+        if plugin_manager.has("task_status_change"):
+            plugin_manager.fire("task_status_change", task=task,
+                                old_status=old_status, new_status=updates["status"])
 
     if "priority" in updates:
         changed["priority"] = (task.priority, updates["priority"])
@@ -258,15 +280,15 @@ def cmd_update_task(task_id: int, **updates):
         changed["description"] = (task.description, updates["description"])
         task.description = updates["description"]
 
-    from datetime import datetime
-    task.updated_at = datetime.now().isoformat()
+    task.updated_at = now_iso
     save_tasks(tasks)
 
     add_event("task_updated", "task", task.id, task.assignee_id or 0,
-              {"changed_fields": list(changed.keys())})
+              {"changed_fields": list(changed.keys())}, now_iso=now_iso)
 
     # Fire post-update hook
-    plugin_manager.fire("task_post_update", task=task, changes=changed)
+    if plugin_manager.has("task_post_update"):
+        plugin_manager.fire("task_post_update", task=task, changes=changed)
 
     print(f"Updated task #{task_id}: {', '.join(changed.keys())}")
     return True
@@ -275,18 +297,15 @@ def cmd_update_task(task_id: int, **updates):
 def cmd_delete_task(task_id: int, user_id: int = 0, **kwargs):
     """Delete a task."""
     tasks = load_tasks()
-    task = None
-    for t in tasks:
-        if t.id == task_id:
-            task = t
-            break
+    task = index_by_id(tasks).get(task_id)
 
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
         return False
 
     # Fire pre-delete hook
-    plugin_manager.fire("task_pre_delete", task=task)
+    if plugin_manager.has("task_pre_delete"):
+        plugin_manager.fire("task_pre_delete", task=task)
 
     # Remove all dependencies involving this task
     dependencies = load_dependencies()
@@ -303,7 +322,8 @@ def cmd_delete_task(task_id: int, user_id: int = 0, **kwargs):
               {"title": task.title, "project_id": task.project_id})
 
     # Fire post-delete hook
-    plugin_manager.fire("task_post_delete", task_id=task_id)
+    if plugin_manager.has("task_post_delete"):
+        plugin_manager.fire("task_post_delete", task_id=task_id)
 
     print(f"Deleted task #{task_id}")
     return True
@@ -340,7 +360,8 @@ def cmd_export(format: str = "csv", output: str = "", filters: Optional[dict] =
         tasks = apply_filters(tasks, filters)
 
     # Fire pre-export hook
-    plugin_manager.fire("export_pre", format=format, count=len(tasks))
+    if plugin_manager.has("export_pre"):
+        plugin_manager.fire("export_pre", format=format, count=len(tasks))
 
     if format == "csv":
         filepath = output or "tasks_export.csv"
@@ -356,7 +377,8 @@ def cmd_export(format: str = "csv", output: str = "", filters: Optional[dict] =
         return False
 
     # Fire post-export hook
-    plugin_manager.fire("export_post", format=format, filepath=filepath, count=count)
+    if plugin_manager.has("export_post"):
+        plugin_manager.fire("export_post", format=format, filepath=filepath, count=count)
 
     print(f"Exported {count} tasks to {filepath}")
     return True
@@ -424,19 +446,21 @@ def cmd_run_recurring(user_id: int, **kwargs):
     """Check all active rules, create new tasks for those where should_run() is True, advance the rule."""
     rules = load_recurring_rules()
     tasks = load_tasks()
+    tasks_by_id = index_by_id(tasks)
+    next_id = max((t.id for t in tasks), default=0) + 1
     created_count = 0
 
     for rule in rules:
         if rule.should_run():
             # Find the template task
-            template = get_task_by_id(rule.task_template_id)
+            template = tasks_by_id.get(rule.task_template_id)
             if not template:
                 print(f"Warning: Template task #{rule.task_template_id} not found for rule #{rule.id}", file=sys.stderr)
                 continue
 
             # Create a new task from the template
             new_task = Task(
-                id=get_next_task_id(),
+                id=next_id,
                 title=template.title,
                 project_id=template.project_id,
                 assignee_id=template.assignee_id,
@@ -447,6 +471,7 @@ def cmd_run_recurring(user_id: int, **kwargs):
                 due_date=template.due_date,
             )
             tasks.append(new_task)
+            next_id += 1
             created_count += 1
 
             # Advance the rule
@@ -462,11 +487,7 @@ def cmd_run_recurring(user_id: int, **kwargs):
 def cmd_cancel_recurring(rule_id: int, **kwargs):
     """Set rule.active = False."""
     rules = load_recurring_rules()
-    rule = None
-    for r in rules:
-        if r.id == rule_id:
-            rule = r
-            break
+    rule = index_by_id(rules).get(rule_id)
 
     if not rule:
         print(f"Error: Recurring rule #{rule_id} not found", file=sys.stderr)
@@ -486,12 +507,13 @@ def cmd_cancel_recurring(rule_id: int, **kwargs):
 def cmd_add_dependency(task_id: int, depends_on_id: int, **kwargs):
     """Create a dependency. Validates both tasks exist, no self-dependency, no duplicate, no circular."""
     # Validate both tasks exist
-    task = get_task_by_id(task_id)
+    tasks_by_id = index_by_id(load_tasks())
+    task = tasks_by_id.get(task_id)
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
         return False
 
-    depends_on_task = get_task_by_id(depends_on_id)
+    depends_on_task = tasks_by_id.get(depends_on_id)
     if not depends_on_task:
         print(f"Error: Task #{depends_on_id} not found", file=sys.stderr)
         return False
@@ -531,7 +553,8 @@ def cmd_add_dependency(task_id: int, depends_on_id: int, **kwargs):
 
 def cmd_list_dependencies(task_id: int, **kwargs):
     """Show what a task depends on and what depends on it."""
-    task = get_task_by_id(task_id)
+    tasks_by_id = index_by_id(load_tasks())
+    task = tasks_by_id.get(task_id)
     if not task:
         print(f"Error: Task #{task_id} not found", file=sys.stderr)
         return False
@@ -544,7 +567,7 @@ def cmd_list_dependencies(task_id: int, **kwargs):
     if depends_on:
         print(f"This task depends on ({len(depends_on)}):")
         for d in depends_on:
-            dep_task = get_task_by_id(d.depends_on_id)
+            dep_task = tasks_by_id.get(d.depends_on_id)
             if dep_task:
                 print(f"  - Task #{dep_task.id}: {dep_task.title} (status: {dep_task.status})")
     else:
@@ -557,7 +580,7 @@ def cmd_list_dependencies(task_id: int, **kwargs):
     if dependents:
         print(f"Tasks that depend on this ({len(dependents)}):")
         for d in dependents:
-            dep_task = get_task_by_id(d.task_id)
+            dep_task = tasks_by_id.get(d.task_id)
             if dep_task:
                 print(f"  - Task #{dep_task.id}: {dep_task.title} (status: {dep_task.status})")
     else:
@@ -595,90 +618,70 @@ def cmd_dashboard(days: int = 7, user_id: Optional[int] = None, **kwargs):
     now = datetime.now()
     start_date = now - timedelta(days=days)
 
-    # Filter by date range
-    tasks_created_in_period = []
-    tasks_completed_in_period = []
+    # One pass over the tasks; each timestamp is parsed at most once
+    created_count = 0
+    completed_count = 0
+    total_completion_time = timedelta()
+    valid_completion_times = 0
+    # Activity keys are gathered per source and tallied below, created
+    # before completed, so ties resolve as they did over the joined lists
+    created_users = []
+    completed_users = []
+    created_projects = []
+    completed_projects = []
+    overdue_count = 0
 
     for t in tasks:
+        if t.is_overdue():
+            overdue_count += 1
+
+        in_scope = not user_id or t.assignee_id == user_id
+
         try:
             created = datetime.fromisoformat(t.created_at)
-            if created >= start_date:
-                tasks_created_in_period.append(t)
         except ValueError:
-            pass
+            created = None
+        if created is not None and created >= start_date and in_scope:
+            created_count += 1
+            if t.assignee_id:
+                created_users.append(t.assignee_id)
+            created_projects.append(t.project_id)
 
         if t.completed_at:
             try:
                 completed = datetime.fromisoformat(t.completed_at)
-                if completed >= start_date:
-                    tasks_completed_in_period.append(t)
             except ValueError:
-                pass
-
-    # Filter by user if specified
-    if user_id:
-        tasks_created_in_period = [t for t in tasks_created_in_period if t.assignee_id == user_id]
-        tasks_completed_in_period = [t for t in tasks_completed_in_period if t.assignee_id == user_id]
-
-    # Compute metrics
-    created_count = len(tasks_created_in_period)
-    completed_count = len(tasks_completed_in_period)
+                continue
+            if completed >= start_date and in_scope:
+                completed_count += 1
+                if t.assignee_id:
+                    completed_users.append(t.assignee_id)
+                completed_projects.append(t.project_id)
+                if created is not None:
+                    total_completion_time += (completed - created)
+                    valid_completion_times += 1
+
+    # Tasks by status breakdown, counted in C
+    status_breakdown = dict(Counter(map(attrgetter("status"), tasks)))
 
     completion_rate = 0.0
     if created_count > 0:
         completion_rate = (completed_count / created_count) * 100
 
-    # Average completion time
-    total_completion_time = timedelta()
-    valid_completion_times = 0
-    for t in tasks_completed_in_period:
-        try:
-            created = datetime.fromisoformat(t.created_at)
-            completed = datetime.fromisoformat(t.completed_at)
-            total_completion_time += (completed - created)
-            valid_completion_times += 1
-        except (ValueError, TypeError):
-            pass
-
     avg_completion_time = None
     if valid_completion_times > 0:
         avg_seconds = total_completion_time.total_seconds() / valid_completion_times
         avg_completion_time = timedelta(seconds=avg_seconds)
 
     # Most active user (who created/completed the most tasks)
-    user_activity = {}
-    for t in tasks_created_in_period + tasks_completed_in_period:
-        uid = t.assignee_id
-        if uid:
-            user_activity[uid] = user_activity.get(uid, 0) + 1
-
-    most_active_user_id = None
-    most_active_user_count = 0
-    for uid, count in user_activity.items():
-        if count > most_active_user_count:
-            most_active_user_id = uid
-            most_active_user_count = count
+    user_activity = Counter(chain(created_users, completed_users))
+    most_active_user_id, most_active_user_count = max(
+        user_activity.items(), key=itemgetter(1), default=(None, 0))
 
     # Busiest project
-    project_activity = {}
-    for t in tasks_created_in_period + tasks_completed_in_period:
-        pid = t.project_id
-        project_activity[pid] = project_activity.get(pid, 0) + 1
-
-    busiest_project_id = None
-    busiest_project_count = 0
-    for pid, count in project_activity.items():
-        if count > busiest_project_count:
-            busiest_project_id = pid
-            busiest_project_count = count
-
-    # Overdue tasks count
-    overdue_count = sum(1 for t in tasks if t.is_overdue())
-
-    # Tasks by status breakdown
-    status_breakdown = {}
-    for t in tasks:
-        status_breakdown[t.status] = status_breakdown.get(t.status, 0) + 1
+    project_activity = Counter(chain(created_projects, completed_projects))
+    busiest_project_id, busiest_project_count = max(
+        project_activity.items(), key=itemgetter(1), default=(None, 0))
 
     # Create dashboard data
     dashboard_data = {
@@ -43,17 +43,17 @@ def filter_due_within(tasks: List[Task], days: int) -> List[Task]:
     """Return tasks due within the next N days."""
     now = datetime.now()
     cutoff = now + timedelta(days=days)
-    result = []
-    for t in tasks:
-        if not t.due_date or t.status == "done":
-            continue
-        try:
-            due = datetime.fromisoformat(t.due_date)
-            if now <= due <= cutoff:
-                result.append(t)
-        except ValueError:
-            continue
-    return result
+    return [t for t in tasks if _is_due_between(t, now, cutoff)]
+
+
+def _is_due_between(t: Task, start: datetime, end: datetime) -> bool:
+    """Whether an open task falls due between start and end."""
+    if not t.due_date or t.status == "done":
+        return False
+    try:
+        return start <= datetime.fromisoformat(t.due_date) <= end
+    except ValueError:
+        return False
 
 
 def filter_completed_between(tasks: List[Task], start: str, end: str) -> List[Task]:
@@ -105,6 +105,40 @@ def sort_tasks(tasks: List[Task], sort_by: str = "created_at",
     return sorted(tasks, key=key_fn, reverse=reverse)
 
 
+# Condition on a task `t` for each filter key, in the order apply_filters
+# applies them. Each refers to the filter value by the key's own name.
+_FILTER_CONDITIONS = {
+    "status": "t.status == status",
+    "priority": "t.priority == priority",
+    "tag": "tag in t.tags",
+    "assignee_id": "t.assignee_id == assignee_id",
+    "project_id": "t.project_id == project_id",
+    "overdue": "t.is_overdue()",
+    "due_within_days": "_is_due_between(t, *due_within_days)",
+    "search": "(search in t.title.lower() or search in t.description.lower())",
+}
+
+# Compiled filter functions keyed by the tuple of filter keys they test
+_compiled_filters = {}
+
+
+def _compile_filter(keys: tuple) -> Callable[..., List[Task]]:
+    """Compile one list comprehension testing every condition in `keys`.
+
+    Only the key names go into the generated source; the filter values are
+    passed in as arguments. A single pass with the conditions and-ed
+    together avoids building an intermediate list per filter.
+    """
+    fn = _compiled_filters.get(keys)
+    if fn is None:
+        params = ", ".join(("tasks",) + keys)
+        conditions = " and ".join(_FILTER_CONDITIONS[k] for k in keys)
+        source = f"lambda {params}: [t for t in tasks if {conditions}]"
+        fn = eval(compile(source, "<filters>", "eval"), {"_is_due_between": _is_due_between})
+        _compiled_filters[keys] = fn
+    return fn
+
+
 def apply_filters(tasks: List[Task], filters: dict) -> List[Task]:
     """Apply multiple filters from a dict.
 
@@ -113,24 +147,29 @@ def apply_filters(tasks: List[Task], filters: dict) -> List[Task]:
         overdue (bool), due_within_days (int),
         search (str), sort_by (str), sort_reverse (bool)
     """
-    result = list(tasks)
-
+    values = {}
     if "status" in filters:
-        result = filter_by_status(result, filters["status"])
+        values["status"] = filters["status"]
     if "priority" in filters:
-        result = filter_by_priority(result, filters["priority"])
+        values["priority"] = filters["priority"]
     if "tag" in filters:
-        result = filter_by_tag(result, filters["tag"])
+        values["tag"] = filters["tag"]
     if "assignee_id" in filters:
-        result = filter_by_assignee(result, int(filters["assignee_id"]))
+        values["assignee_id"] = int(filters["assignee_id"])
     if "project_id" in filters:
-        result = filter_by_project(result, int(filters["project_id"]))
+        values["project_id"] = int(filters["project_id"])
     if filters.get("overdue"):
-        result = filter_overdue(result)
+        values["overdue"] = True
     if "due_within_days" in filters:
-        result = filter_due_within(result, int(filters["due_within_days"]))
+        now = datetime.now()
+        values["due_within_days"] = (now, now + timedelta(days=int(filters["due_within_days"])))
     if "search" in filters:
-        result = search_tasks(result, filters["search"])
+        values["search"] = filters["search"].lower()
+
+    if values:
+        result = _compile_filter(tuple(values))(tasks, **values)
+    else:
+        result = list(tasks)
 
     sort_by = filters.get("sort_by", "created_at")
     sort_reverse = filters.get("sort_reverse", False)
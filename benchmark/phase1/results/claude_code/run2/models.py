@@ -90,20 +90,25 @@ class Task:
         except ValueError:
             return False
 
-    def mark_done(self):
+    # Both take an optional now_iso so a command can stamp every change it
+    # makes with one timestamp instead of reading the clock per field.
+
+    def mark_done(self, now_iso: Optional[str] = None):
+        now_iso = now_iso or datetime.now().isoformat()
         self.status = "done"
-        self.completed_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.completed_at = now_iso
+        self.updated_at = now_iso
 
-    def update_status(self, new_status: str):
+    def update_status(self, new_status: str, now_iso: Optional[str] = None):
         valid = [s.value for s in TaskStatus]
         if new_status not in valid:
             raise ValueError(f"Invalid status '{new_status}'. Valid: {valid}")
+        now_iso = now_iso or datetime.now().isoformat()
         old_status = self.status
         self.status = new_status
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = now_iso
         if new_status == "done":
-            self.completed_at = datetime.now().isoformat()
+            self.completed_at = now_iso
         return old_status
 
     def to_dict(self) -> dict:
@@ -83,10 +83,18 @@ class PluginManager:
             self._hooks[hook_name] = hook
         hook.register(callback)
 
+    def has(self, hook_name: str) -> bool:
+        """Whether a named hook has any callbacks.
+
+        Lets callers skip building a hook's arguments when nobody listens.
+        """
+        hook = self._hooks.get(hook_name)
+        return hook is not None and bool(hook._callbacks)
+
     def fire(self, hook_name: str, **kwargs) -> List[Any]:
         """Fire a named hook."""
         hook = self._hooks.get(hook_name)
-        if hook is None:
+        if hook is None or not hook._callbacks:
             return []
         return hook.fire(**kwargs)
 
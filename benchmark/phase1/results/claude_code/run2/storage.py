@@ -5,11 +5,17 @@ JSON file-based persistence for all entities.
 """
 
 import json
+import marshal
 import os
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from models import User, Task, Project, EventLog, Comment, RecurringRule, TaskDependency
 
+try:
+    import orjson  # optional C-accelerated JSON codec
+except ImportError:
+    orjson = None
+
 
 DATA_DIR = Path("data")
 USERS_FILE = DATA_DIR / "users.json"
@@ -26,19 +32,157 @@ def ensure_data_dir():
     DATA_DIR.mkdir(exist_ok=True)
 
 
+# Parsed file contents keyed by path, stamped with the file's (mtime_ns, size).
+# Stored marshalled so every load hands out fresh objects that callers may
+# mutate; marshal.loads is several times faster than re-parsing the JSON.
+_parse_cache: Dict[Path, tuple] = {}
+
+
+def _encode(data, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, indented by 2 spaces if asked."""
+    if orjson is not None:
+        # Same bytes as json.dumps(indent=2, ensure_ascii=False) for our records
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+_decode = orjson.loads if orjson is not None else json.loads
+
+
+def _load_cached(filepath: Path, parse) -> list:
+    """Load a file through _parse_cache, parsing its bytes with parse()."""
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return []
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _parse_cache.get(filepath)
+    if cached is not None and cached[0] == stamp:
+        return marshal.loads(cached[1])
+    with open(filepath, "rb") as f:
+        data = parse(f.read())
+    _parse_cache[filepath] = (stamp, marshal.dumps(data))
+    return data
+
+
 def _load_json(filepath: Path) -> list:
     """Load a JSON array from file."""
-    if not filepath.exists():
-        return []
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_cached(filepath, _decode)
+
+
+def _parse_json_lines(raw: bytes) -> list:
+    # Files written before the log became line-based hold a single array
+    if raw.lstrip().startswith(b"["):
+        return _decode(raw)
+    lines = [line for line in raw.splitlines() if line.strip()]
+    records = [_decode(line) for line in lines[:-1]]
+    if lines:
+        try:
+            records.append(_decode(lines[-1]))
+        except ValueError:
+            # An interrupted append can leave a partial last line; skip it
+            pass
+    return records
+
+
+def _load_json_lines(filepath: Path) -> list:
+    """Load records stored one JSON object per line."""
+    return _load_cached(filepath, _parse_json_lines)
 
 
 def _save_json(filepath: Path, data: list):
     """Save a JSON array to file."""
     ensure_data_dir()
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _parse_cache.pop(filepath, None)
+    with open(filepath, "wb") as f:
+        f.write(_encode(data, indent=True))
+
+
+def _save_json_lines(filepath: Path, data: list):
+    """Save records to file, one JSON object per line."""
+    ensure_data_dir()
+    _parse_cache.pop(filepath, None)
+    with open(filepath, "wb") as f:
+        f.writelines(_encode(r) + b"\n" for r in data)
+
+
+def _append_json_line(filepath: Path, record: dict):
+    """Append one record to a file of JSON lines without rewriting it.
+
+    A partial last line left by an interrupted append is cut off first,
+    so the new record starts on a line of its own.
+    """
+    ensure_data_dir()
+    _parse_cache.pop(filepath, None)
+    with open(filepath, "a+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                f.truncate(_line_start(f, end))
+        f.write(_encode(record) + b"\n")
+
+
+def _line_start(f, end: int) -> int:
+    """Return the offset just past the last newline before end, or 0."""
+    block = 4096
+    while True:
+        start = max(0, end - block)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b"\n")
+        if newline != -1:
+            return start + newline + 1
+        if start == 0:
+            return 0
+        block *= 2
+
+
+def _holds_json_array(filepath: Path) -> bool:
+    """True if filepath still holds a single JSON array, not JSON lines."""
+    try:
+        with open(filepath, "rb") as f:
+            return f.read(1) == b"["
+    except FileNotFoundError:
+        return False
+
+
+def _last_json_line(filepath: Path) -> Optional[dict]:
+    """Return the last record of a JSON-lines file, reading only its tail.
+
+    Returns None for a missing or empty file. A partial last line left by
+    an interrupted append is skipped in favour of the one before it.
+    """
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        block = 4096
+        while True:
+            start = max(0, end - block)
+            f.seek(start)
+            lines = [line for line in f.read().split(b"\n") if line.strip()]
+            # With the first line possibly cut off, only trust it at offset 0
+            if start > 0:
+                lines = lines[1:]
+            if len(lines) > 1 or start == 0:
+                if not lines:
+                    return None
+                try:
+                    return _decode(lines[-1])
+                except ValueError:
+                    return _decode(lines[-2]) if len(lines) > 1 else None
+            block *= 2
+
+
+def index_by_id(items: list) -> dict:
+    """Map id -> item. If ids repeat the first item wins, as with a scan."""
+    index = {}
+    for item in items:
+        index.setdefault(item.id, item)
+    return index
 
 
 # ---- Users ----
@@ -121,29 +265,41 @@ def get_next_task_id() -> int:
 # ---- Events ----
 
 def load_events() -> List[EventLog]:
-    raw = _load_json(EVENTS_FILE)
+    raw = _load_json_lines(EVENTS_FILE)
     return [EventLog(**r) for r in raw]
 
 
 def save_events(events: List[EventLog]):
-    _save_json(EVENTS_FILE, [e.to_dict() for e in events])
+    _save_json_lines(EVENTS_FILE, [e.to_dict() for e in events])
 
 
 def add_event(event_type: str, entity_type: str, entity_id: int,
-              user_id: int, details: Dict[str, Any] = None):
-    """Append a single event to the log."""
-    events = load_events()
-    new_id = max((e.id for e in events), default=0) + 1
+              user_id: int, details: Dict[str, Any] = None,
+              now_iso: Optional[str] = None):
+    """Append a single event to the log, stamped now_iso if given.
+
+    The log is append-only: the event is written as one more line and
+    its id follows the last one in the file, so the existing history is
+    neither parsed nor rewritten.
+    """
+    if _holds_json_array(EVENTS_FILE):
+        # A log from before events were stored as lines: convert it once
+        events = load_events()
+        save_events(events)
+        new_id = max((e.id for e in events), default=0) + 1
+    else:
+        last = _last_json_line(EVENTS_FILE)
+        new_id = last["id"] + 1 if last else 1
     event = EventLog(
         id=new_id,
         event_type=event_type,
         entity_type=entity_type,
         entity_id=entity_id,
         user_id=user_id,
+        timestamp=now_iso or "",
         details=details or {},
     )
-    events.append(event)
-    save_events(events)
+    _append_json_line(EVENTS_FILE, event.to_dict())
     return event
 
 
@@ -186,6 +186,32 @@ class TestStorage(BaseTestCase):
         events = storage.load_events()
         self.assertEqual(len(events), 1)
 
+    def test_add_event_appends_lines(self):
+        storage.add_event("task_created", "task", 1, 1)
+        storage.add_event("task_updated", "task", 1, 1, {"status": "done"})
+        lines = storage.EVENTS_FILE.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])["id"], 2)
+        self.assertEqual(len(storage.get_events_for_entity("task", 1)), 2)
+
+    def test_add_event_converts_array_log(self):
+        old = [models.EventLog(id=i, event_type="task_created", entity_type="task",
+                               entity_id=i, user_id=1).to_dict() for i in (1, 3, 2)]
+        storage._save_json(storage.EVENTS_FILE, old)
+        e = storage.add_event("task_created", "task", 4, 1)
+        self.assertEqual(e.id, 4)
+        self.assertEqual([ev.id for ev in storage.load_events()], [1, 3, 2, 4])
+        self.assertFalse(storage.EVENTS_FILE.read_text(encoding="utf-8").startswith("["))
+
+    def test_add_event_after_partial_last_line(self):
+        storage.add_event("task_created", "task", 1, 1)
+        with open(storage.EVENTS_FILE, "ab") as f:
+            f.write(b'{"id": 2, "event_ty')
+        self.assertEqual([e.id for e in storage.load_events()], [1])
+        e = storage.add_event("task_updated", "task", 1, 1)
+        self.assertEqual(e.id, 2)
+        self.assertEqual([ev.id for ev in storage.load_events()], [1, 2])
+
     def test_comments_round_trip(self):
         comments = [models.Comment(id=1, task_id=1, user_id=1, text="Hello")]
         storage.save_comments(comments)
@@ -275,6 +301,17 @@ class TestFilters(BaseTestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0].priority, "critical")
 
+    def test_apply_filters_all_conditions(self):
+        tasks = self._make_tasks()
+        result = filters.apply_filters(tasks, {"assignee_id": "1", "project_id": 1,
+                                               "tag": "bug", "search": "BUG",
+                                               "sort_by": "id"})
+        self.assertEqual([t.id for t in result], [1, 4])
+        result = filters.apply_filters(tasks, {"overdue": True, "tag": "bug"})
+        self.assertEqual([t.id for t in result], [1])
+        result = filters.apply_filters(tasks, {"due_within_days": 2, "status": "in_progress"})
+        self.assertEqual([t.id for t in result], [2])
+
 
 # ====================================================================
 # Validator Tests
@@ -427,6 +464,19 @@ class TestPlugins(BaseTestCase):
         result = pm.fire("nonexistent_hook")
         self.assertEqual(result, [])
 
+    def test_has_tracks_callbacks(self):
+        pm = plugins.PluginManager()
+
+        def cb(**kw):
+            return None
+
+        self.assertFalse(pm.has("task_post_create"))
+        self.assertFalse(pm.has("nonexistent_hook"))
+        pm.register("task_post_create", cb)
+        self.assertTrue(pm.has("task_post_create"))
+        pm.get_hook("task_post_create").unregister(cb)
+        self.assertFalse(pm.has("task_post_create"))
+
     def test_callback_error_handling(self):
         hook = plugins.PluginHook("test")
         hook.register(lambda **kw: 1 / 0)
@@ -644,6 +694,23 @@ class TestRecurringTasks(BaseTestCase):
         rules = storage.load_recurring_rules()
         self.assertEqual(rules[0].created_count, 1)
 
+    def test_cmd_run_recurring_assigns_distinct_ids(self):
+        """Test tasks created from several rules in one run get their own ids."""
+        storage.save_projects([models.Project(id=1, name="Test", owner_id=1)])
+        storage.save_tasks([models.Task(id=1, title="Standup", project_id=1),
+                            models.Task(id=5, title="Review", project_id=1)])
+        yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+        storage.save_recurring_rules([
+            models.RecurringRule(id=1, task_template_id=1, frequency="daily", next_run=yesterday),
+            models.RecurringRule(id=2, task_template_id=5, frequency="weekly", next_run=yesterday),
+        ])
+
+        commands.cmd_run_recurring(user_id=1)
+
+        tasks = storage.load_tasks()
+        self.assertEqual([(t.id, t.title) for t in tasks],
+                         [(1, "Standup"), (5, "Review"), (6, "Standup"), (7, "Review")])
+
     def test_cmd_run_recurring_respects_end_date(self):
         """Test recurring with end_date in the past does not create tasks."""
         storage.save_users([models.User(id=1, username="test", email="test@test.com")])
@@ -753,6 +820,17 @@ class TestTaskDependencies(BaseTestCase):
         result = commands.cmd_add_dependency(3, 1)
         self.assertFalse(result)
 
+    def test_circular_dependency_long_chain(self):
+        """Test cycle detection over a chain longer than the recursion limit."""
+        n = sys.getrecursionlimit() + 100
+        chain = [models.TaskDependency(id=i, task_id=i + 1, depends_on_id=i)
+                 for i in range(1, n)]
+        ok, msg = validators.validate_no_circular_dependency(1, n, chain)
+        self.assertFalse(ok)
+        self.assertIn("Circular dependency", msg)
+        ok, _ = validators.validate_no_circular_dependency(n, 1, chain)
+        self.assertTrue(ok)
+
     def test_cmd_delete_task_removes_dependencies(self):
         """Test cmd_delete_task removes associated dependencies."""
         storage.save_users([models.User(id=1, username="test", email="test@test.com")])
@@ -806,6 +884,16 @@ class TestTaskDependencies(BaseTestCase):
         task = storage.get_task_by_id(2)
         self.assertEqual(task.status, "done")
 
+    def test_update_to_current_values_is_not_saved(self):
+        storage.save_tasks([models.Task(id=1, title="A", project_id=1,
+                                        status="done", tags=["x"])])
+        before = storage.TASKS_FILE.read_bytes()
+
+        self.assertTrue(commands.cmd_update_task(1, title="A", status="done", tags=["x"]))
+
+        self.assertEqual(storage.TASKS_FILE.read_bytes(), before)
+        self.assertEqual(storage.load_events(), [])
+
 
 # ====================================================================
 # Activity Dashboard Tests
@@ -138,38 +138,29 @@ def validate_no_circular_dependency(task_id: int, depends_on_id: int, existing_d
     Returns (valid, error_message).
     Must detect cycles transitively (e.g., A→B→C→A).
     """
-    # Build a dependency graph
+    # Build a dependency graph: task -> tasks it depends on
     graph = {}
     for dep in existing_deps:
-        if dep.task_id not in graph:
-            graph[dep.task_id] = []
-        graph[dep.task_id].append(dep.depends_on_id)
-
-    # Add the proposed new dependency
-    if task_id not in graph:
-        graph[task_id] = []
-    new_graph = {k: v.copy() for k, v in graph.items()}
-    if task_id not in new_graph:
-        new_graph[task_id] = []
-    new_graph[task_id].append(depends_on_id)
-
-    # Check if adding this dependency creates a cycle
-    # Use DFS to detect if depends_on_id can reach task_id
-    def has_path(start: int, target: int, visited: Set[int]) -> bool:
-        if start == target:
-            return True
-        if start in visited:
-            return False
-        visited.add(start)
-
-        if start in new_graph:
-            for neighbor in new_graph[start]:
-                if has_path(neighbor, target, visited):
-                    return True
+        graph.setdefault(dep.task_id, []).append(dep.depends_on_id)
+
+    # The new edge task_id -> depends_on_id closes a cycle exactly when
+    # depends_on_id can already reach task_id. Walk with an explicit stack
+    # so long dependency chains cannot exhaust the recursion limit.
+    def has_path(start: int, target: int) -> bool:
+        visited: Set[int] = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for neighbor in graph.get(node, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
         return False
 
     # Check if depends_on_id can reach task_id (which would create a cycle)
-    if has_path(depends_on_id, task_id, set()):
+    if has_path(depends_on_id, task_id):
         return False, f"Circular dependency detected: Task #{depends_on_id} already depends (transitively) on Task #{task_id}"
 
     return True, ""